@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(scope='session')
+def prepared_readers():
+    """準備済み画像の ImageReader のキャッシュ（(画像パス, セル幅, セル高さ) -> ImageReader）
+
+    セッション全体で共有し、条件を変えてPDF生成を繰り返しても画像の準備は一度だけにする。
+    """
+    return {}
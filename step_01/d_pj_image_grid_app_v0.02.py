@@ -1,6 +1,5 @@
-import os
+import io
 import sys
-import tempfile
 
 from PIL import Image
 from PyQt6.QtCore import QSize, Qt
@@ -10,6 +9,7 @@ from PyQt6.QtWidgets import (QApplication, QComboBox, QDoubleSpinBox,
                              QMessageBox, QPushButton, QScrollArea,
                              QVBoxLayout, QWidget)
 from reportlab.lib.pagesizes import A3, A4
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 
@@ -175,17 +175,21 @@ class ImageGridApp(QWidget):
         cols = max(1, int(page_width / col_width_pt))
         rows = max(1, int(page_height / row_height_pt))
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pdf = canvas.Canvas(file_path, pagesize=self.page_size)
-            
-            for row in range(rows):
-                for col in range(cols):
-                    cell_index = row * cols + col
-                    # 画像がない場合は最初の画像を使用（繰り返し）
-                    img_index = cell_index % len(self.image_paths) if self.image_paths else 0
+        pdf = canvas.Canvas(file_path, pagesize=self.page_size)
+        
+        # 画像ごとにエンコード済みJPEGをメモリ上に1つだけ保持する（一時ファイルは使わない）
+        jpeg_buffers = {}
+        
+        for row in range(rows):
+            for col in range(cols):
+                cell_index = row * cols + col
+                # 画像がない場合は最初の画像を使用（繰り返し）
+                img_index = cell_index % len(self.image_paths) if self.image_paths else 0
+                
+                if self.image_paths:
+                    img_path = self.image_paths[img_index]
                     
-                    if self.image_paths:
-                        img_path = self.image_paths[img_index]
+                    if img_path not in jpeg_buffers:
                         img = Image.open(img_path)
                         
                         # アスペクト比を維持したままセル内に収まるようリサイズ
@@ -202,10 +206,8 @@ class ImageGridApp(QWidget):
                             new_height = row_height_pt
                             new_width = row_height_pt * img_aspect
                         
-                        # セル内でセンタリング
-                        x_offset = col * col_width_pt + (col_width_pt - new_width) / 2
-                        y_offset = page_height - (row + 1) * row_height_pt + (row_height_pt - new_height) / 2
-                        
+                        # JPEGはDCTスケーリングで縮小デコードし、フル解像度の展開を避ける
+                        img.draft('RGB', (int(new_width) * 2, int(new_height) * 2))
                         img = img.resize((int(new_width), int(new_height)))
                         
                         # RGBAモードの画像をCMYKモードに変換
@@ -215,12 +217,19 @@ class ImageGridApp(QWidget):
                         # RGBをCMYKに変換
                         img_cmyk = img.convert('CMYK')
                         
-                        temp_img_path = os.path.join(temp_dir, f"temp_{row}_{col}.jpg")
-                        img_cmyk.save(temp_img_path)
-                        
-                        pdf.drawImage(temp_img_path, x_offset, y_offset, new_width, new_height)
-            
-            pdf.save()
+                        buffer = io.BytesIO()
+                        img_cmyk.save(buffer, format='JPEG')
+                        jpeg_buffers[img_path] = (buffer.getvalue(), new_width, new_height)
+                    
+                    jpeg_bytes, new_width, new_height = jpeg_buffers[img_path]
+                    
+                    # セル内でセンタリング
+                    x_offset = col * col_width_pt + (col_width_pt - new_width) / 2
+                    y_offset = page_height - (row + 1) * row_height_pt + (row_height_pt - new_height) / 2
+                    
+                    pdf.drawImage(ImageReader(io.BytesIO(jpeg_bytes)), x_offset, y_offset, new_width, new_height)
+        
+        pdf.save()
         QMessageBox.information(self, "完了", f"PDFを作成しました: {file_path}")
 
     def dragEnterEvent(self, event: QDragEnterEvent):
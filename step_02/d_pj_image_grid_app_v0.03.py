@@ -8,13 +8,15 @@ from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from PIL import Image, UnidentifiedImageError
-from PyQt5.QtCore import QRectF, QSize, Qt, QThread, pyqtSignal
-from PyQt5.QtGui import (QColor, QDragEnterEvent, QDropEvent, QImage, QPainter,
-                         QPen, QPixmap)
+from PyQt5.QtCore import QSize, Qt, QThread, pyqtSignal
+from PyQt5.QtGui import (QColor, QDragEnterEvent, QDropEvent, QImage,
+                         QPainterPath, QPen, QPixmap)
 from PyQt5.QtWidgets import (QApplication, QCheckBox, QColorDialog, QComboBox,
-                             QDoubleSpinBox, QFileDialog, QFrame, QGridLayout,
-                             QGroupBox, QHBoxLayout, QLabel, QMainWindow,
-                             QMenu, QMenuBar, QMessageBox, QProgressDialog,
+                             QDoubleSpinBox, QFileDialog, QGraphicsPathItem,
+                             QGraphicsPixmapItem, QGraphicsScene,
+                             QGraphicsView, QGridLayout, QGroupBox,
+                             QHBoxLayout, QLabel, QMainWindow, QMenu,
+                             QMenuBar, QMessageBox, QProgressDialog,
                              QPushButton, QScrollArea, QSpinBox, QSplitter,
                              QVBoxLayout, QWidget)
 from reportlab.lib.pagesizes import A3, A4
@@ -275,15 +277,14 @@ class PDFGenerationThread(QThread):
         pdf.setStrokeColorRGB(r, g, b)
         pdf.setLineWidth(self.settings.grid_width)
         
-        # 垂直線
-        for col in range(cols + 1):
-            x = col * col_width_pt
-            pdf.line(x, 0, x, page_height)
+        # 垂直線（1回の呼び出しでまとめて描画）
+        pdf.lines([(col * col_width_pt, 0, col * col_width_pt, page_height)
+                   for col in range(cols + 1)])
         
-        # 水平線
-        for row in range(rows + 1):
-            y = page_height - row * row_height_pt
-            pdf.line(0, y, page_width, y)
+        # 水平線（1回の呼び出しでまとめて描画）
+        pdf.lines([(0, page_height - row * row_height_pt,
+                    page_width, page_height - row * row_height_pt)
+                   for row in range(rows + 1)])
 
 
 class ImageGridApp(QMainWindow):
@@ -449,7 +450,8 @@ class ImageGridApp(QMainWindow):
         self.row_height_spinbox.setRange(10.0, 297.0)
         self.row_height_spinbox.setValue(self.settings.row_height_mm)
         self.row_height_spinbox.setSuffix(" mm")
-        self.row_height_spinbox.valueChanged.connect(self.update_grid)
+        self.row_height_spinbox.valueChanged.connect(self._on_cell_size_changed)
+        self.row_height_spinbox.editingFinished.connect(self.update_grid)
         layout.addWidget(QLabel("行の高さ:"))
         layout.addWidget(self.row_height_spinbox)
 
@@ -458,7 +460,8 @@ class ImageGridApp(QMainWindow):
         self.col_width_spinbox.setRange(10.0, 210.0)
         self.col_width_spinbox.setValue(self.settings.col_width_mm)
         self.col_width_spinbox.setSuffix(" mm")
-        self.col_width_spinbox.valueChanged.connect(self.update_grid)
+        self.col_width_spinbox.valueChanged.connect(self._on_cell_size_changed)
+        self.col_width_spinbox.editingFinished.connect(self.update_grid)
         layout.addWidget(QLabel("列の幅:"))
         layout.addWidget(self.col_width_spinbox)
 
@@ -529,6 +532,21 @@ class ImageGridApp(QMainWindow):
         self.preview_area_scroll.setWidgetResizable(True)
         layout.addWidget(self.preview_area_scroll)
 
+        # プレビュー用のシーンとビュー（用紙を模したビュー、再利用する）
+        self.preview_scene = QGraphicsScene(self)
+        self.preview_view = QGraphicsView(self.preview_scene)
+        self.preview_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.preview_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.preview_view.setStyleSheet("""
+            QGraphicsView {
+                background-color: white;
+                border: 1px solid #cccccc;
+                border-radius: 2px;
+            }
+        """)
+        self.preview_view.hide()
+        self.preview_grid_item: Optional[QGraphicsPathItem] = None
+
     def load_images(self):
         # サポートする画像形式を拡張
         files, _ = QFileDialog.getOpenFileNames(
@@ -557,7 +575,8 @@ class ImageGridApp(QMainWindow):
             self.settings.page_size = A3
             self.row_height_spinbox.setRange(10.0, 420.0)  # A3の高さ制限
             self.col_width_spinbox.setRange(10.0, 297.0)   # A3の幅制限
-        self.update_preview()
+        # setRange による値の丸めは valueChanged しか発火せず画像が再配置されないため、ここで反映する
+        self.update_grid()
 
     @lru_cache(maxsize=100)
     def _create_thumbnail(self, img_path: str) -> QPixmap:
@@ -576,11 +595,15 @@ class ImageGridApp(QMainWindow):
             label.setParent(None)
         self.preview_labels = []
 
-        # グリッドコンテナのクリア
+        # グリッドコンテナのクリア（プレビュー用のビューは再利用する）
         while self.preview_area_grid.count():
             item = self.preview_area_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+            widget = item.widget()
+            if widget and widget is not self.preview_view:
+                widget.deleteLater()
+        self.preview_view.hide()
+        self.preview_scene.clear()
+        self.preview_grid_item = None
 
         if not self.image_paths:
             # 画像がない場合は初期メッセージを表示
@@ -603,17 +626,10 @@ class ImageGridApp(QMainWindow):
         preview_height = DEFAULT_PREVIEW_HEIGHT
         preview_width = int(preview_height * (self.settings.page_size[0] / self.settings.page_size[1]))
         
-        # プレビュー用のフレームを作成（用紙を模したフレーム）
-        self.preview_frame = QFrame()
-        self.preview_frame.setFixedSize(preview_width, preview_height)
-        self.preview_frame.setFrameShape(QFrame.Shape.Box)
-        self.preview_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #cccccc;
-                border-radius: 2px;
-            }
-        """)
+        # プレビュー用のビューを用紙サイズに合わせる
+        self.preview_scene.setSceneRect(0, 0, preview_width, preview_height)
+        frame_width = 2 * self.preview_view.frameWidth()
+        self.preview_view.setFixedSize(preview_width + frame_width, preview_height + frame_width)
         
         # 行と列の数を計算
         col_width_pt = self.settings.col_width_mm * MM_TO_PT
@@ -625,70 +641,98 @@ class ImageGridApp(QMainWindow):
         cell_width = preview_width / (self.settings.page_size[0] / col_width_pt)
         cell_height = preview_height / (self.settings.page_size[1] / row_height_pt)
         
-        # 画像を描画するためのpaintEventを設定
-        def paint_preview(event):
-            painter = QPainter(self.preview_frame)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # ループ不変の値を事前計算
+        cell_aspect = cell_width / cell_height
+        image_count = len(self.image_paths)
+        
+        # 画像ごとの描画サイズとセンタリング量を事前計算
+        cell_layouts: Dict[str, Tuple[QPixmap, float, float]] = {}
+        for img_path in set(self.image_paths):
+            thumbnail = self._create_thumbnail(img_path)
+            if thumbnail.isNull():
+                continue
+            img_aspect = thumbnail.width() / thumbnail.height()
             
-            # 画像の描画
-            for row in range(rows):
-                for col in range(cols):
-                    cell_index = row * cols + col
-                    img_index = cell_index % len(self.image_paths) if self.image_paths else 0
-                    
-                    if self.image_paths:
-                        img_path = self.image_paths[img_index]
-                        thumbnail = self._create_thumbnail(img_path)
-                        
-                        # セルのサイズとアスペクト比を計算
-                        cell_rect_width = cell_width
-                        cell_rect_height = cell_height
-                        cell_aspect = cell_rect_width / cell_rect_height
-                        
-                        # 画像のアスペクト比を計算
-                        img_aspect = thumbnail.width() / thumbnail.height()
-                        
-                        # アスペクト比に基づいてサイズを調整
-                        if img_aspect > cell_aspect:
-                            new_width = cell_rect_width
-                            new_height = cell_rect_width / img_aspect
-                        else:
-                            new_height = cell_rect_height
-                            new_width = cell_rect_height * img_aspect
-                        
-                        # セル内での位置を計算（センタリング）
-                        x = col * cell_width + (cell_width - new_width) / 2
-                        y = row * cell_height + (cell_height - new_height) / 2
-                        
-                        # 画像を描画
-                        target_rect = QRectF(x, y, new_width, new_height)
-                        source_rect = QRectF(thumbnail.rect())
-                        painter.drawPixmap(target_rect, thumbnail, source_rect)
+            # アスペクト比に基づいてサイズを調整
+            if img_aspect > cell_aspect:
+                new_width = cell_width
+                new_height = cell_width / img_aspect
+            else:
+                new_height = cell_height
+                new_width = cell_height * img_aspect
             
-            # グリッド線の描画
-            if self.settings.grid_line_visible:
-                pen = QPen(self.settings.grid_color)
-                pen.setWidth(self.settings.grid_width)
-                painter.setPen(pen)
-                
-                # 垂直線
-                for col in range(cols + 1):
-                    x = col * cell_width
-                    painter.drawLine(int(x), 0, int(x), preview_height)
-                
-                # 水平線
-                for row in range(rows + 1):
-                    y = row * cell_height
-                    painter.drawLine(0, int(y), preview_width, int(y))
+            # セルサイズへの高品質な縮小はここで一度だけ行い、シーンには等倍で配置する
+            cell_pixmap = thumbnail.scaled(max(1, round(new_width)), max(1, round(new_height)),
+                                           Qt.AspectRatioMode.IgnoreAspectRatio,
+                                           Qt.TransformationMode.SmoothTransformation)
             
-            painter.end()
+            cell_layouts[img_path] = (
+                cell_pixmap,
+                (cell_width - new_width) / 2,
+                (cell_height - new_height) / 2,
+            )
+        
+        # 各セルに画像アイテムを配置（描画・再描画はシーングラフに任せる）
+        for row in range(rows):
+            for col in range(cols):
+                layout = cell_layouts.get(self.image_paths[(row * cols + col) % image_count])
+                if layout is None:
+                    continue
+                cell_pixmap, dx, dy = layout
+                
+                item = QGraphicsPixmapItem(cell_pixmap)
+                # セルサイズに縮小済みの画像を等倍で配置するため、補間は不要
+                item.setTransformationMode(Qt.TransformationMode.FastTransformation)
+                item.setPos(col * cell_width + dx, row * cell_height + dy)
+                self.preview_scene.addItem(item)
         
-        # paintEventを設定
-        self.preview_frame.paintEvent = paint_preview
+        # グリッド線の描画
+        self._update_grid_layer()
         
-        # プレビューフレームをレイアウトに追加
-        self.preview_area_grid.addWidget(self.preview_frame)
-        self.preview_frame.update()
+        # プレビュー用のビューをレイアウトに追加
+        self.preview_area_grid.addWidget(self.preview_view)
+        self.preview_view.show()
+
+    def _on_cell_size_changed(self) -> None:
+        """入力中の軽量な更新：設定には反映するが、画像の再配置は編集確定時まで行わずグリッド線のみ更新"""
+        self.settings.row_height_mm = self.row_height_spinbox.value()
+        self.settings.col_width_mm = self.col_width_spinbox.value()
+        self._update_grid_layer()
+
+    def _update_grid_layer(self) -> None:
+        """グリッド線のレイヤーのみを作り直す（画像アイテムには触れない）"""
+        if self.preview_grid_item is not None:
+            self.preview_scene.removeItem(self.preview_grid_item)
+            self.preview_grid_item = None
+        
+        if not self.image_paths or not self.settings.grid_line_visible:
+            return
+        
+        scene_rect = self.preview_scene.sceneRect()
+        preview_width, preview_height = scene_rect.width(), scene_rect.height()
+        
+        # 行と列の数を計算
+        col_width_pt = self.settings.col_width_mm * MM_TO_PT
+        row_height_pt = self.settings.row_height_mm * MM_TO_PT
+        cols = max(1, int(self.settings.page_size[0] / col_width_pt))
+        rows = max(1, int(self.settings.page_size[1] / row_height_pt))
+        
+        # プレビューでのセルサイズを計算
+        cell_width = preview_width / (self.settings.page_size[0] / col_width_pt)
+        cell_height = preview_height / (self.settings.page_size[1] / row_height_pt)
+        
+        pen = QPen(self.settings.grid_color)
+        pen.setWidth(self.settings.grid_width)
+        
+        # 全ての線を1つのパスアイテムにまとめる
+        grid_path = QPainterPath()
+        for col in range(cols + 1):
+            grid_path.moveTo(col * cell_width, 0)
+            grid_path.lineTo(col * cell_width, preview_height)
+        for row in range(rows + 1):
+            grid_path.moveTo(0, row * cell_height)
+            grid_path.lineTo(preview_width, row * cell_height)
+        self.preview_grid_item = self.preview_scene.addPath(grid_path, pen)
 
     def select_grid_color(self):
         """グリッド線の色を選択するダイアログを表示"""
@@ -1,26 +1,36 @@
+import hashlib
 import io
 import json
 import logging
 import os
 import sys
 import tempfile
-from dataclasses import asdict, dataclass, field
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from PIL import Image, UnidentifiedImageError
-from PyQt6.QtCore import QRectF, QSize, Qt, QThread, pyqtSignal
-from PyQt6.QtGui import (QColor, QDragEnterEvent, QDropEvent, QImage, QPainter,
-                         QPen, QPixmap)
+import numpy as np
+from PIL import Image, ImageFilter, UnidentifiedImageError
+from PyQt6.QtCore import (QObject, QRunnable, QSize, Qt, QThread, QThreadPool,
+                          QTimer, pyqtSignal)
+from PyQt6.QtGui import (QColor, QDragEnterEvent, QDropEvent, QImage,
+                         QPainterPath, QPen, QPixmap, QPixmapCache)
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QColorDialog, QComboBox,
                              QDialog, QDialogButtonBox, QDoubleSpinBox,
-                             QFileDialog, QFrame, QGridLayout, QGroupBox,
+                             QFileDialog, QGraphicsPathItem, QGraphicsPixmapItem,
+                             QGraphicsScene, QGraphicsView, QGridLayout, QGroupBox,
                              QHBoxLayout, QLabel, QLineEdit, QListWidget,
                              QListWidgetItem, QMainWindow, QMenu, QMenuBar,
                              QMessageBox, QProgressDialog, QPushButton,
                              QScrollArea, QSpinBox, QSplitter, QVBoxLayout,
                              QWidget)
 from reportlab.lib.pagesizes import A3, A4
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 # ロギングの設定
@@ -34,7 +44,31 @@ DEFAULT_COL_WIDTH_MM: float = 100.0
 DEFAULT_GRID_WIDTH: int = 1
 DEFAULT_PREVIEW_HEIGHT: int = 600
 THUMBNAIL_SIZE: Tuple[int, int] = (200, 200)  # プレビュー用のサムネイルサイズ
+PREVIEW_DEBOUNCE_MS: int = 80  # プレビュー更新要求をまとめる待ち時間（ミリ秒）
+THUMBNAIL_CACHE_DIR: Path = Path.home() / ".dana_pj_cache"  # サムネイルのディスクキャッシュ
+THUMBNAIL_CACHE_MAX_ENTRIES: int = 1000  # ディスクキャッシュに保持するサムネイルの最大数（古いものから削除）
+PROCESSED_IMAGE_CACHE_SIZE: int = 64  # プレビュー用に保持する処理済み画像の最大数
+PSD_COMPOSITE_CACHE_SIZE: int = 4  # 保持するPSDレイヤーの合成結果の最大数（原寸のため少なめにする）
+SCALED_CACHE_LIMIT_KB: int = 65536  # セルサイズに縮小済みの画像を保持する QPixmapCache の上限（KB）
+SCALED_CACHE_BUCKET_PX: int = 4  # 縮小済み画像のサイズをまとめる刻み（ピクセル）
+CONTENT_HASH_HEAD_BYTES: int = 65536  # 同一画像の判定でハッシュを取るファイル先頭のバイト数
+PREVIEW_FAST_SCALE_RATIO: float = 2.0  # 縮小率がこれ以下なら最近傍補間（FastTransformation）で縮小する（拡大は常に補間）
 SETTINGS_FILE: str = "grid_settings.json"  # 設定ファイルのパス
+PDF_RENDER_DPI: int = 150  # 出力サイズが不明な場合のPDFページのラスタライズ解像度
+TRUST_LARGE_IMAGES: bool = False  # True にすると巨大画像の解凍爆弾チェックを無効化する（信頼できる入力のみ）
+CMS_LUT_GRID_SIZE: int = 17  # プレビュー用のRGB→CMYK近似LUTの格子点数（各軸）
+
+# 色変換方法とLittleCMSのレンダリングインテント番号の対応
+CMS_RENDERING_INTENTS: Dict[str, int] = {
+    'perceptual': 0,  # 知覚的
+    'relative': 1,    # 相対的
+    'saturation': 2,  # 彩度優先
+    'absolute': 3     # 絶対的
+}
+
+# 大判の印刷用データがPillowの解凍爆弾チェックで弾かれないようにする
+if TRUST_LARGE_IMAGES:
+    Image.MAX_IMAGE_PIXELS = None
 
 # サポートする画像形式
 SUPPORTED_IMAGE_FORMATS = {
@@ -43,6 +77,15 @@ SUPPORTED_IMAGE_FORMATS = {
     "PDF Files": "*.pdf",
     "All Supported Files": "*.png *.jpg *.jpeg *.psd *.pdf"
 }
+SUPPORTED_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.psd', '.pdf'})
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+    logger.info("orjsonによる設定ファイルの高速読み書きが有効です")
+except ImportError:
+    ORJSON_SUPPORT = False
+    logger.info("orjsonがインストールされていません。標準のjsonモジュールを使用します。")
 
 try:
     import psd_tools
@@ -60,6 +103,22 @@ except ImportError:
     PDF_SUPPORT = False
     logger.warning("PyMuPDFがインストールされていません。PDF形式はサポートされません。")
 
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_SUPPORT = True
+    logger.info("PDFiumによるPDFページのラスタライズが有効です")
+except ImportError:
+    PDFIUM_SUPPORT = False
+    logger.info("pypdfium2がインストールされていません。PDFからの画像抽出にはPyMuPDFを使用します。")
+
+try:
+    import pyvips
+    VIPS_SUPPORT = True
+    logger.info("libvipsによる高速サムネイル生成が有効です")
+except (ImportError, OSError):
+    VIPS_SUPPORT = False
+    logger.info("pyvipsがインストールされていません。サムネイル生成にはPillowを使用します。")
+
 @dataclass
 class GridSettings:
     # ... (GridSettings クラス - 変更なし)
@@ -72,13 +131,17 @@ class GridSettings:
     page_size: Tuple[float, float] = A4
 
     def to_dict(self) -> Dict[str, Any]:
-        """設定を辞書形式に変換"""
-        settings_dict = asdict(self)
-        # QColorをRGB値のタプルに変換
-        settings_dict['grid_color'] = self.grid_color.getRgb()
-        # ページサイズを文字列に変換
-        settings_dict['page_size'] = 'A4' if self.page_size == A4 else 'A3'
-        return settings_dict
+        """設定を辞書形式に変換（asdict の再帰的なコピーを避けて直接組み立てる）"""
+        return {
+            'row_height_mm': self.row_height_mm,
+            'col_width_mm': self.col_width_mm,
+            'grid_line_visible': self.grid_line_visible,
+            # QColorをRGB値のタプルに変換
+            'grid_color': self.grid_color.getRgb(),
+            'grid_width': self.grid_width,
+            # ページサイズを文字列に変換
+            'page_size': 'A4' if self.page_size == A4 else 'A3',
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GridSettings':
@@ -95,50 +158,58 @@ class GridSettings:
         return cls(**data)
 
     def save_to_file(self, file_path: str = SETTINGS_FILE) -> None:
-        """設定をファイルに保存"""
+        """設定をファイルに保存（一時ファイルに書き込んでから置き換える）"""
+        temp_path = f"{file_path}.tmp"
         try:
-            # 既存の設定ファイルをバックアップ
-            if os.path.exists(file_path):
-                backup_path = f"{file_path}.backup"
-                import shutil
-                shutil.copy2(file_path, backup_path)
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=4)
+            if ORJSON_SUPPORT:
+                data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.to_dict(), indent=2).encode('utf-8')
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            # アトミックに置き換えるため、書き込み途中の設定ファイルが読まれることはない
+            os.replace(temp_path, file_path)
             logger.info(f"設定を保存しました: {file_path}")
         except Exception as e:
             logger.error(f"設定の保存中にエラーが発生しました: {e}")
-            # バックアップから復元
-            backup_path = f"{file_path}.backup"
-            if os.path.exists(backup_path):
-                try:
-                    import shutil
-                    shutil.copy2(backup_path, file_path)
-                    logger.info("設定ファイルをバックアップから復元しました")
-                except Exception as restore_error:
-                    logger.error(f"設定ファイルの復元中にエラーが発生しました: {restore_error}")
+            # 書き込みに失敗した一時ファイルを削除（元の設定ファイルはそのまま残る）
+            try:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError as cleanup_error:
+                logger.error(f"一時ファイルの削除中にエラーが発生しました: {cleanup_error}")
             raise
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """設定ファイルの内容を読み込む（更新日時とサイズが同じ間はキャッシュを返す）"""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+        return orjson.loads(data) if ORJSON_SUPPORT else json.loads(data)
+
     @classmethod
     def load_from_file(cls, file_path: str = SETTINGS_FILE) -> 'GridSettings':
         """設定をファイルから読み込み"""
+        settings_path = Path(file_path)
         try:
-            if not os.path.exists(file_path):
+            try:
+                stat = settings_path.stat()
+            except FileNotFoundError:
                 logger.info(f"設定ファイルが存在しません: {file_path}")
                 return cls()
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return cls.from_dict(data)
+            data = cls._load_cached(file_path, stat.st_mtime_ns, stat.st_size)
+            # from_dict は引数を書き換えるため、キャッシュされた辞書のコピーを渡す
+            return cls.from_dict(dict(data))
         except json.JSONDecodeError as e:
             logger.error(f"設定ファイルの形式が不正です: {e}")
-            # 破損した設定ファイルをバックアップ
-            backup_path = f"{file_path}.backup"
+            # 破損した設定ファイルを退避（コピーせずにリネームする）
             try:
-                if os.path.exists(file_path):
-                    import shutil
-                    shutil.copy2(file_path, backup_path)
-                    os.remove(file_path)
+                settings_path.replace(settings_path.with_name(f"{settings_path.name}.backup"))
+            except FileNotFoundError:
+                pass
             except Exception as backup_error:
                 logger.error(f"設定ファイルのバックアップ中にエラーが発生しました: {backup_error}")
             return cls()
@@ -147,13 +218,31 @@ class GridSettings:
             return cls()
 
 
+@dataclass
+class PSDLayerInfo:
+    """PSDレイヤーの情報（レイヤー選択ダイアログ用）"""
+    index: int
+    name: str
+    visible: bool
+    size: Tuple[int, int]
+
+
+# PSDレイヤーの合成結果 (ファイルパス, 更新日時, レイヤー番号) -> 画像（古いものから破棄するLRU）
+# 画像読み込みのスレッドとPDF生成スレッドから同時に参照されるためロックで保護する
+_psd_composite_cache: 'OrderedDict[Tuple[str, int, int], Image.Image]' = OrderedDict()
+_psd_composite_cache_lock = threading.Lock()
+
+
 class ImageProcessor:
-    # ... (ImageProcessor クラス - _load_psd() メソッドを修正)
+    # ... (ImageProcessor クラス - PSDの読み込みをレイヤー一覧取得と合成に分割)
     """画像処理クラス"""
 
     def __init__(self):
         self.cmyk_profile_path = None
         self.color_conversion_intent = 'perceptual'  # perceptual, relative, saturation, absolute
+        self._cmyk_transforms: Dict[Tuple[str, str], Any] = {}  # (プロファイル, 色変換方法) -> 変換
+        self._cmyk_lut_filters: Dict[Tuple[str, str], ImageFilter.Color3DLUT] = {}  # プレビュー用LUT
+        self.psd_layer_indices: Dict[str, int] = {}  # PSDファイルパス -> 使用するレイヤー番号
         logger.info("ImageProcessor initialized")
 
     def set_cmyk_profile(self, profile_path: str) -> None:
@@ -174,17 +263,60 @@ class ImageProcessor:
         self.color_conversion_intent = intent
         logger.info(f"色変換方法を設定: {intent}")
 
-    @staticmethod
-    def convert_to_cmyk(image: Image.Image, profile_path: str = None,
-                       intent: str = 'perceptual') -> Image.Image:
-        """画像をCMYK形式に変換（ICCプロファイル対応）"""
+    def _get_cmyk_transform(self, profile_path: str, intent: str) -> Any:
+        """sRGB→CMYKの変換を構築してキャッシュする（プロファイル解析とLUT構築は一度だけ）"""
+        from PIL import ImageCms
+
+        key = (profile_path, intent)
+        transform = self._cmyk_transforms.get(key)
+        if transform is None:
+            srgb_profile = ImageCms.createProfile("sRGB")
+            cmyk_profile = ImageCms.getOpenProfile(profile_path)
+            transform = ImageCms.buildTransformFromOpenProfiles(
+                srgb_profile, cmyk_profile, 'RGB', 'CMYK',
+                renderingIntent=CMS_RENDERING_INTENTS.get(intent, CMS_RENDERING_INTENTS['absolute'])
+            )
+            self._cmyk_transforms[key] = transform
+            logger.info(f"CMYK変換を構築: {profile_path}, 色変換方法: {intent}")
+        return transform
+
+    def _build_rgb_cmyk_lut(self, profile_path: str, intent: str) -> np.ndarray:
+        """RGB格子をICC変換して (N, N, N, 4) のCMYK LUTを作成する（インデックスは [r, g, b]）"""
+        from PIL import ImageCms
+
+        n = CMS_LUT_GRID_SIZE
+        levels = np.linspace(0, 255, n).round().astype(np.uint8)
+        r, g, b = np.meshgrid(levels, levels, levels, indexing='ij')
+        grid = np.stack([r, g, b], axis=-1).reshape(n * n, n, 3)
+        grid_img = Image.frombytes('RGB', (n, n * n), grid.tobytes())
+        cmyk_img = ImageCms.applyTransform(grid_img, self._get_cmyk_transform(profile_path, intent))
+        return np.asarray(cmyk_img, dtype=np.float32).reshape(n, n, n, 4)
+
+    def _get_cmyk_lut_filter(self, profile_path: str, intent: str) -> ImageFilter.Color3DLUT:
+        """プレビュー用のRGB→CMYK LUTフィルタを作成してキャッシュする"""
+        key = (profile_path, intent)
+        lut_filter = self._cmyk_lut_filters.get(key)
+        if lut_filter is None:
+            lut = self._build_rgb_cmyk_lut(profile_path, intent)
+            # Color3DLUT はRが最も速く変化する [b, g, r] 順の0～1のテーブルを受け取る
+            table = (lut / 255.0).transpose(2, 1, 0, 3).reshape(-1, 4)
+            lut_filter = ImageFilter.Color3DLUT(lut.shape[0], table, channels=4, target_mode='CMYK')
+            self._cmyk_lut_filters[key] = lut_filter
+            logger.info(f"プレビュー用CMYK LUTを構築: {profile_path}, 色変換方法: {intent}")
+        return lut_filter
+
+    def convert_to_cmyk(self, image: Image.Image, profile_path: str = None,
+                        intent: str = 'perceptual', preview_mode: bool = False) -> Image.Image:
+        """画像をCMYK形式に変換（ICCプロファイル対応）
+
+        preview_mode が True の場合は、事前に作成したLUTによる近似変換を行う（印刷用には使用しない）
+        """
         try:
             from PIL import ImageCms
 
             if profile_path and os.path.exists(profile_path):
                 # ICCプロファイルを使用した変換
-                srgb_profile = ImageCms.createProfile("sRGB")
-                cmyk_profile = ImageCms.getOpenProfile(profile_path)
+                transform = self._get_cmyk_transform(profile_path, intent)
 
                 if image.mode == 'RGBA':
                     # アルファチャンネルを白背景で合成
@@ -195,22 +327,12 @@ class ImageProcessor:
                 if image.mode != 'RGB':
                     image = image.convert('RGB')
 
-                # 色変換方法を設定
-                if intent == 'perceptual':
-                    intent = ImageCms.INTENT_PERCEPTUAL
-                elif intent == 'relative':
-                    intent = ImageCms.INTENT_RELATIVE_COLORIMETRIC
-                elif intent == 'saturation':
-                    intent = ImageCms.INTENT_SATURATION
-                else:  # absolute
-                    intent = ImageCms.INTENT_ABSOLUTE_COLORIMETRIC
-
-                # 正確なプロファイル変換を適用
-                return ImageCms.profileToProfile(
-                    image, srgb_profile, cmyk_profile,
-                    outputMode='CMYK',
-                    intent=intent
-                )
+                if preview_mode:
+                    # プレビュー表示用：LUTのトライリニア補間で高速に近似変換
+                    return image.filter(self._get_cmyk_lut_filter(profile_path, intent))
+
+                # 構築済みの変換を適用
+                return ImageCms.applyTransform(image, transform)
             else:
                 # 従来の変換方法にフォールバック
                 if image.mode == 'CMYK':
@@ -231,85 +353,162 @@ class ImageProcessor:
                 image = background
             return image.convert('CMYK')
 
+    def convert_to_cmyk_downsampled(self, image: Image.Image, target_size: tuple,
+                                    profile_path: str = None, intent: str = 'perceptual',
+                                    preview_mode: bool = False) -> Image.Image:
+        """target_size 以下に縮小してからCMYK形式に変換する
+
+        ICC変換のコストは画素数に比例するため、必ず縮小を先に行う。
+        通常は呼び出し側で縮小済みの画像が渡される。大きい画像が渡された場合は警告を出し、
+        呼び出し側の画像を書き換えないようコピーを縮小する。
+        """
+        if image.width > target_size[0] or image.height > target_size[1]:
+            logger.warning(f"縮小されていない画像を受け取りました: {image.size} -> {target_size}")
+            image = image.copy()
+            image.thumbnail(target_size, Image.Resampling.BILINEAR)
+        return self.convert_to_cmyk(image, profile_path, intent, preview_mode=preview_mode)
+
     @staticmethod
-    def load_image(file_path: str) -> Optional[Image.Image]:
-        """画像ファイルを読み込む"""
+    def load_image(file_path: str, target_size: Optional[tuple] = None,
+                   psd_layer_index: int = 0) -> Optional[Image.Image]:
+        """画像ファイルを読み込む（target_size はPDFのラスタライズやJPEGの縮小デコードに使用）"""
         try:
             logger.info(f"画像の読み込みを開始: {file_path}")
 
             # ファイル拡張子を取得
             ext = os.path.splitext(file_path)[1].lower()
 
-            if ext == '.psd' and PSD_SUPPORT:
+            # 対応していない形式はファイルを開く前に除外する
+            if ext not in SUPPORTED_EXTS:
+                logger.info(f"対応していない形式のためスキップ: {file_path}")
+                return None
+
+            if ext == '.psd':
+                if not PSD_SUPPORT:
+                    logger.warning(f"PSD形式はサポートされていないためスキップ: {file_path}")
+                    return None
                 logger.info("PSDファイルを読み込み")
-                return ImageProcessor._load_psd(file_path)
-            elif ext == '.pdf' and PDF_SUPPORT:
+                return ImageProcessor._composite_psd_layer(file_path, psd_layer_index)
+            elif ext == '.pdf':
+                if not (PDFIUM_SUPPORT or PDF_SUPPORT):
+                    logger.warning(f"PDF形式はサポートされていないためスキップ: {file_path}")
+                    return None
                 logger.info("PDFファイルを読み込み")
-                return ImageProcessor._load_pdf(file_path)
+                return ImageProcessor._load_pdf(file_path, target_size)
             else:
                 # 通常の画像ファイル
                 logger.info("通常の画像ファイルを読み込み")
-                return Image.open(file_path)
+                img = Image.open(file_path)
+                if target_size and ext in ('.jpg', '.jpeg'):
+                    # libjpegのDCTスケーリングで目標サイズに近い解像度のままデコードする
+                    img.draft('RGB', target_size)
+                return img
         except Exception as e:
             logger.error(f"画像の読み込みに失敗: {file_path}, エラー: {e}", exc_info=True)
             return None
 
     @staticmethod
-    def _load_psd(file_path: str) -> Optional[Image.Image]:
-        """PSDファイルを読み込む"""
-        psd = None  # psd を初期化
+    def _list_psd_layers(file_path: str) -> List[PSDLayerInfo]:
+        """PSDファイルのレイヤー一覧を取得する（GUIに依存しない）"""
+        logger.info(f"PSDファイルのレイヤー一覧を取得: {file_path}")
+        psd = psd_tools.PSDImage.open(file_path)
+        layers = [
+            PSDLayerInfo(index=i, name=layer.name, visible=layer.visible, size=tuple(layer.size))
+            for i, layer in enumerate(psd)
+        ]
+        # レイヤー情報をログ出力
+        logger.info(f"レイヤー数: {len(layers)}")
+        for info in layers:
+            logger.info(f"レイヤー {info.index}: 名前={info.name}, 可視={info.visible}, サイズ={info.size}")
+        return layers
+
+    @staticmethod
+    def _composite_psd_layer(file_path: str, layer_index: int) -> Optional[Image.Image]:
+        """PSDファイルの指定レイヤーを合成する（GUIに依存しないため別スレッドから呼び出せる）"""
+        psd = None
         try:
-            logger.info(f"PSDファイルを読み込み開始: {file_path}")
-            psd = psd_tools.PSDImage.open(file_path) # with ステートメントを削除
-
-            # レイヤー情報をログ出力
-            logger.info(f"レイヤー数: {len(psd)}")
-            for i, layer in enumerate(psd):
-                logger.info(f"レイヤー {i}: 名前={layer.name}, 可視={layer.visible}, サイズ={layer.size}")
-
-            # レイヤー選択ダイアログを表示
-            dialog = PSDLayerDialog(psd)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                selected_index = dialog.get_selected_layer_index()
-                if selected_index is not None:
-                    logger.info(f"選択されたレイヤー: {selected_index}")
-                    try:
-                        # 選択されたレイヤーを取得
-                        if len(psd) > selected_index:
-                            selected_layer = psd[selected_index]
-                            logger.info(f"選択されたレイヤーの情報: 名前={selected_layer.name}, 可視={selected_layer.visible}, サイズ={selected_layer.size}")
-
-                            # レイヤーを合成
-                            logger.info("レイヤーの合成を開始")
-                            composite = selected_layer.composite()
-                            logger.info(f"合成完了: サイズ={composite.size}, モード={composite.mode}")
-                            return composite
-                        else:
-                            raise ValueError("選択されたレイヤーが存在しません")
-                    except Exception as e:
-                        logger.error(f"レイヤーの合成中にエラーが発生: {e}", exc_info=True)
-                        return None
-                else:
-                    logger.info("レイヤー選択がキャンセルされました")
-                    return None
+            cache_key = (file_path, os.stat(file_path).st_mtime_ns, layer_index)
+            with _psd_composite_cache_lock:
+                cached = _psd_composite_cache.get(cache_key)
+                if cached is not None:
+                    _psd_composite_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.info(f"PSDレイヤーの合成結果をキャッシュから取得: {file_path}, レイヤー: {layer_index}")
+                # 呼び出し側でリサイズ等を行うためコピーを返す
+                return cached.copy()
+
+            logger.info(f"PSDファイルを読み込み開始: {file_path}, レイヤー: {layer_index}")
+            psd = psd_tools.PSDImage.open(file_path)
+            if not 0 <= layer_index < len(psd):
+                raise ValueError("選択されたレイヤーが存在しません")
+
+            selected_layer = psd[layer_index]
+            logger.info(f"選択されたレイヤーの情報: 名前={selected_layer.name}, 可視={selected_layer.visible}, サイズ={selected_layer.size}")
+
+            # レイヤーの範囲だけを合成（範囲が空の場合はドキュメント全体を合成）
+            logger.info("レイヤーの合成を開始")
+            left, top, right, bottom = selected_layer.bbox
+            if right > left and bottom > top:
+                composite = selected_layer.composite(viewport=selected_layer.bbox, apply_icc=False, force=False)
+            else:
+                composite = psd.composite(apply_icc=False)
+            if composite is None:
+                raise ValueError("レイヤーの合成結果が空です")
+            logger.info(f"合成完了: サイズ={composite.size}, モード={composite.mode}")
+
+            with _psd_composite_cache_lock:
+                _psd_composite_cache[cache_key] = composite
+                _psd_composite_cache.move_to_end(cache_key)
+                while len(_psd_composite_cache) > PSD_COMPOSITE_CACHE_SIZE:
+                    _psd_composite_cache.popitem(last=False)
+            return composite.copy()
 
         except Exception as e:
-            logger.error(f"PSDファイルの読み込みに失敗: {file_path}, エラー: {e}", exc_info=True)
+            logger.error(f"PSDレイヤーの合成に失敗: {file_path}, エラー: {e}", exc_info=True)
             return None
         finally:
-            # PSDファイルを確実に閉じる (try-finally ブロック内で close() を呼び出す)
-            if psd: # psd が None でない場合のみ close() を呼び出す
+            # PSDファイルを確実に閉じる（close() を持たないバージョンのpsd-toolsもある）
+            if psd is not None and hasattr(psd, 'close'):
                 try:
                     psd.close()
                     logger.info("PSDファイルを閉じました")
                 except Exception as e:
                     logger.error(f"PSDファイルのクローズ中にエラーが発生: {e}")
 
+    @staticmethod
+    def _load_pdf(file_path: str, target_size: Optional[tuple] = None) -> Optional[Image.Image]:
+        """PDFファイルの最初のページを画像として読み込む"""
+        if PDFIUM_SUPPORT:
+            return ImageProcessor._render_pdf_page(file_path, target_size)
+        return ImageProcessor._extract_pdf_image(file_path)
 
     @staticmethod
-    def _load_pdf(file_path: str) -> Optional[Image.Image]:
-        # ... (_load_pdf() メソッド - 変更なし)
-        """PDFファイルから画像を抽出"""
+    def _render_pdf_page(file_path: str, target_size: Optional[tuple] = None) -> Optional[Image.Image]:
+        """PDFiumで最初のページを必要なサイズだけラスタライズする（ベクターPDFにも対応）"""
+        pdf = None
+        try:
+            pdf = pdfium.PdfDocument(file_path)
+            page = pdf[0]
+            page_width, page_height = page.get_size()  # ポイント単位
+
+            if target_size:
+                # 出力サイズに収まる倍率で描画し、後段の縮小処理を最小限にする
+                scale = min(target_size[0] / page_width, target_size[1] / page_height)
+            else:
+                scale = PDF_RENDER_DPI / 72
+            bitmap = page.render(scale=scale)
+            logger.info(f"PDFページをラスタライズ: 倍率={scale:.3f}")
+            return bitmap.to_pil()
+        except Exception as e:
+            logger.error(f"PDFページのラスタライズに失敗: {file_path}, エラー: {e}", exc_info=True)
+            return None
+        finally:
+            if pdf is not None:
+                pdf.close()
+
+    @staticmethod
+    def _extract_pdf_image(file_path: str) -> Optional[Image.Image]:
+        """PDFファイルから画像を抽出（PyMuPDF）"""
         try:
             doc = fitz.open(file_path)
             # 最初のページから画像を抽出
@@ -331,32 +530,67 @@ class ImageProcessor:
             logger.error(f"PDFファイルからの画像抽出に失敗: {file_path}, エラー: {e}", exc_info=True)
             return None
 
-    def process_image(self, img_path: str, target_size: tuple) -> Optional[Image.Image]:
-        # ... (process_image() メソッド - 変更なし)
-        """画像を処理"""
+    @staticmethod
+    def _thumbnail_vips(file_path: str, target_size: tuple) -> Optional[Image.Image]:
+        """libvipsで縮小デコードしたサムネイルをPIL Imageとして返す"""
+        try:
+            vips_img = pyvips.Image.thumbnail(file_path, target_size[0],
+                                              height=target_size[1], size='down')
+            if vips_img.format != 'uchar':
+                vips_img = vips_img.cast('uchar')
+
+            if vips_img.interpretation == 'cmyk' and vips_img.bands == 4:
+                mode = 'CMYK'
+            else:
+                mode = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}.get(vips_img.bands)
+            if mode is None:
+                logger.warning(f"libvipsで扱えないバンド数です: {vips_img.bands}")
+                return None
+
+            return Image.frombytes(mode, (vips_img.width, vips_img.height),
+                                   vips_img.write_to_memory())
+        except pyvips.Error as e:
+            logger.warning(f"libvipsでのサムネイル生成に失敗、Pillowで再試行します: {file_path}, エラー: {e}")
+            return None
+
+    def process_image(self, img_path: str, target_size: tuple,
+                      preview_mode: bool = False) -> Optional[Image.Image]:
+        """画像を処理（preview_mode はプレビュー表示用の高速なリサイズと近似CMYK変換を有効にする）"""
         try:
             logger.info(f"画像の処理を開始: {img_path}")
 
-            # 画像を読み込む
-            img = self.load_image(img_path)
+            # 通常の画像ファイルはlibvipsで縮小デコード（フル解像度を展開しない）
+            img = None
+            ext = os.path.splitext(img_path)[1].lower()
+            if VIPS_SUPPORT and ext in SUPPORTED_EXTS and ext not in ('.psd', '.pdf'):
+                img = self._thumbnail_vips(img_path, target_size)
+                if img is not None:
+                    logger.info(f"libvipsで画像をリサイズ: {target_size}")
+
             if img is None:
-                logger.error(f"画像の読み込みに失敗: {img_path}")
-                return None
+                # 画像を読み込む
+                img = self.load_image(img_path, target_size, self.psd_layer_indices.get(img_path, 0))
+                if img is None:
+                    logger.error(f"画像の読み込みに失敗: {img_path}")
+                    return None
 
-            # 画像の情報をログ出力
-            logger.info(f"画像情報 - サイズ: {img.size}, モード: {img.mode}")
+                # 画像の情報をログ出力
+                logger.info(f"画像情報 - サイズ: {img.size}, モード: {img.mode}")
 
-            # 画像をリサイズ
-            img.thumbnail(target_size, Image.Resampling.LANCZOS)
-            logger.info(f"画像をリサイズ: {target_size}")
+                # 画像をリサイズ（プレビュー用は軽いBILINEAR、印刷用はLANCZOS）
+                resample = Image.Resampling.BILINEAR if preview_mode else Image.Resampling.LANCZOS
+                img.thumbnail(target_size, resample)
+                logger.info(f"画像をリサイズ: {target_size}")
 
             # CMYKプロファイルが設定されている場合は変換
             if self.cmyk_profile_path:
                 logger.info("CMYK変換を実行")
-                img = self.convert_to_cmyk(
+                img = self.convert_to_cmyk_downsampled(
                     img,
+                    target_size,
                     self.cmyk_profile_path,
-                    self.color_conversion_intent
+                    self.color_conversion_intent,
+                    preview_mode=preview_mode
                 )
                 logger.info(f"CMYK変換完了 - モード: {img.mode}")
 
@@ -383,6 +617,7 @@ class PDFGenerationThread(QThread):
         # CMYK設定を初期化
         self.cmyk_profile_path = None
         self.color_conversion_intent = 'perceptual'
+        self._stroke_rgb: Optional[Tuple[float, float, float]] = None  # キャンバスに設定済みの線の色
 
     def set_cmyk_profile(self, profile_path: str) -> None:
         """CMYKプロファイルを設定"""
@@ -394,11 +629,16 @@ class PDFGenerationThread(QThread):
         self.color_conversion_intent = intent
         self.image_processor.set_color_conversion_intent(intent)
 
+    def set_psd_layer_indices(self, psd_layer_indices: Dict[str, int]) -> None:
+        """PSDファイルごとに選択済みのレイヤー番号を設定"""
+        self.image_processor.psd_layer_indices = dict(psd_layer_indices)
+
     def run(self) -> None:
         try:
             self.temp_dir = tempfile.mkdtemp()  # 一時ディレクトリを作成
             file_path = os.path.join(self.temp_dir, "output.pdf")
             pdf = canvas.Canvas(file_path, pagesize=self.settings.page_size)
+            self._stroke_rgb = None  # 新しいキャンバスでは線の色が未設定
 
             page_width, page_height = self.settings.page_size
 
@@ -411,24 +651,40 @@ class PDFGenerationThread(QThread):
             total_cells = rows * cols
             processed_cells = 0
 
-            # 画像の配置
-            for row in range(rows):
-                for col in range(cols):
-                    cell_index = row * cols + col
-                    img_index = cell_index % len(self.image_paths) if self.image_paths else 0
+            # 画像ごとに一度だけ読み込み・リサイズ・変換を行う（画像間で並列実行）
+            # PDFへの配置はスレッドセーフではないため、後段のループで直列に行う
+            target_size = (int(col_width_pt), int(row_height_pt))
+            unique_paths = list(dict.fromkeys(self.image_paths))
+            max_workers = max(1, min(len(unique_paths), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                prepared_images: Dict[str, Optional[Tuple[Image.Image, ImageReader]]] = dict(zip(
+                    unique_paths,
+                    executor.map(self._prepare_image, unique_paths, repeat(target_size))
+                ))
+
+            # セルの座標と割り当てる画像番号を配列としてまとめて計算
+            xs = np.arange(cols) * col_width_pt
+            ys = page_height - (np.arange(rows) + 1) * row_height_pt
+            img_idx = np.arange(total_cells) % len(self.image_paths) if self.image_paths else None
 
-                    if self.image_paths:
+            # 画像の配置
+            for cell_index, (row, col) in enumerate(np.ndindex(rows, cols)):
+                if img_idx is not None:
+                    img_path = self.image_paths[img_idx[cell_index]]
+                    prepared = prepared_images.get(img_path)
+                    if prepared is not None:
+                        img, img_reader = prepared
                         try:
-                            self._process_image(pdf, self.image_paths[img_index],
-                                              row, col, col_width_pt, row_height_pt,
-                                              page_height, self.temp_dir)
+                            self._process_image(pdf, img, img_reader,
+                                                float(xs[col]), float(ys[row]),
+                                                col_width_pt, row_height_pt)
                         except Exception as e:
-                            logger.error(f"画像の処理中にエラーが発生しました: {self.image_paths[img_index]}, エラー: {e}")
+                            logger.error(f"画像の処理中にエラーが発生しました: {img_path}, エラー: {e}")
                             continue
 
-                    processed_cells += 1
-                    progress = int((processed_cells / total_cells) * 100)
-                    self.progress.emit(progress)
+                processed_cells += 1
+                progress = int((processed_cells / total_cells) * 100)
+                self.progress.emit(progress)
 
             # グリッド線の描画
             if self.settings.grid_line_visible:
@@ -451,33 +707,31 @@ class PDFGenerationThread(QThread):
             except Exception as e:
                 logger.error(f"一時ディレクトリの削除中にエラーが発生しました: {e}")
 
-    def _process_image(self, pdf: canvas.Canvas, img_path: str, row: int, col: int,
-                     col_width_pt: float, row_height_pt: float, page_height: float,
-                     temp_dir: str) -> None:
-        # ... (_process_image() メソッド - 変更なし)
-        """個々の画像を処理してPDFに配置する"""
+    def _prepare_image(self, img_path: str,
+                       target_size: Tuple[int, int]) -> Optional[Tuple[Image.Image, ImageReader]]:
+        """画像を処理してPDF描画用のImageReaderを作成する（画像ごとに一度だけ呼ばれる）"""
         try:
             logger.info(f"画像の処理を開始: {img_path}")
 
             # 画像を読み込む
-            img = self.image_processor.process_image(img_path, (int(col_width_pt), int(row_height_pt)))
+            img = self.image_processor.process_image(img_path, target_size)
             if img is None:
                 logger.error(f"画像の処理に失敗: {img_path}")
-                return
+                return None
             # CMYK形式に変換 (PDFGenerationThread では CMYK 変換しない)
             # CMYK 変換は ImageProcessor.process_image() で行う
-            img_cmyk = img
-
 
-            # TIFFとして保存（CMYK対応）
-            temp_img_path = os.path.join(temp_dir, f"temp_{row}_{col}.tif")
-            img_cmyk.save(temp_img_path, format='TIFF', compression='lzw')
-            logger.info(f"一時ファイルを保存: {temp_img_path}")
+            # 一時TIFFを経由せず、PIL画像をそのままreportlabに渡す（CMYK対応）
+            return img, ImageReader(img)
 
-            # 画像を配置
-            x = col * col_width_pt
-            y = page_height - (row + 1) * row_height_pt
+        except Exception as e:
+            logger.error(f"画像の処理中にエラーが発生: {img_path}, エラー: {e}", exc_info=True)
+            return None
 
+    def _process_image(self, pdf: canvas.Canvas, img_cmyk: Image.Image, img_reader: ImageReader,
+                     x: float, y: float, col_width_pt: float, row_height_pt: float) -> None:
+        """処理済みの画像をPDFの指定セル（左下座標 x, y）に配置する"""
+        try:
             # 画像のアスペクト比を保持
             img_width, img_height = img_cmyk.size
             aspect_ratio = img_width / img_height
@@ -494,11 +748,11 @@ class PDFGenerationThread(QThread):
                 x += (col_width_pt - new_width) / 2
 
             # 画像を配置
-            pdf.drawImage(temp_img_path, x, y, width=new_width, height=new_height)
+            pdf.drawImage(img_reader, x, y, width=new_width, height=new_height)
             logger.info(f"画像を配置: ({x}, {y}), サイズ: {new_width}x{new_height}")
 
         except Exception as e:
-            logger.error(f"画像の処理中にエラーが発生: {img_path}, エラー: {e}", exc_info=True)
+            logger.error(f"画像の配置中にエラーが発生: ({x}, {y}), エラー: {e}", exc_info=True)
             raise
 
     def _draw_grid_lines(self, pdf: canvas.Canvas, cols: int, rows: int,
@@ -506,21 +760,203 @@ class PDFGenerationThread(QThread):
                         page_width: float, page_height: float) -> None:
         # ... (_draw_grid_lines() メソッド - 変更なし)
         """グリッド線を描画する"""
-        r, g, b = (self.settings.grid_color.red() / 255.0,
-                  self.settings.grid_color.green() / 255.0,
-                  self.settings.grid_color.blue() / 255.0)
-        pdf.setStrokeColorRGB(r, g, b)
+        # 線の色は前回設定した色と異なる場合のみ設定する
+        stroke_rgb = self.settings.grid_color.getRgbF()[:3]
+        if stroke_rgb != self._stroke_rgb:
+            pdf.setStrokeColorRGB(*stroke_rgb)
+            self._stroke_rgb = stroke_rgb
         pdf.setLineWidth(self.settings.grid_width)
 
-        # 垂直線
-        for col in range(cols + 1):
-            x = col * col_width_pt
-            pdf.line(x, 0, x, page_height)
+        # 垂直線と水平線をまとめて1つのパスとして描画
+        vlines = [(col * col_width_pt, 0, col * col_width_pt, page_height)
+                  for col in range(cols + 1)]
+        hlines = [(0, page_height - row * row_height_pt, page_width, page_height - row * row_height_pt)
+                  for row in range(rows + 1)]
+        pdf.lines(vlines + hlines)
+
+
+class ThumbnailDiskCache:
+    """プレビュー用サムネイルのディスクキャッシュ（アプリを再起動しても再利用する）
+
+    ファイル名は元画像のパスと処理条件のSHA-1、元画像の更新日時は index.json で管理し、
+    更新日時が変わったり元画像が削除されたりしたエントリは削除する。index.json は使用順に並べ、
+    THUMBNAIL_CACHE_MAX_ENTRIES を超えたら古いものから削除する。
+    ワーカースレッドから呼び出せるようQImageを扱う。
+    """
+
+    def __init__(self, cache_dir: Path = THUMBNAIL_CACHE_DIR,
+                 max_entries: int = THUMBNAIL_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.index_path = cache_dir / "index.json"
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._index: 'OrderedDict[str, int]' = self._load_index()  # キー -> 元画像の更新日時（古い順）
+        self._dirty = False
+        self._prune()
+
+    def _load_index(self) -> 'OrderedDict[str, int]':
+        try:
+            with open(self.index_path, 'rb') as f:
+                return OrderedDict(json.loads(f.read()))
+        except FileNotFoundError:
+            return OrderedDict()
+        except Exception as e:
+            logger.error(f"サムネイルキャッシュの索引の読み込みに失敗しました: {e}")
+            return OrderedDict()
+
+    def _prune(self) -> None:
+        """上限を超えた古いエントリと、索引に無いサムネイルのファイルを削除する"""
+        with self._lock:
+            self._evict_over_limit()
+            keys = set(self._index)
+        try:
+            for png_path in self.cache_dir.glob("*.png"):
+                if png_path.stem not in keys:
+                    png_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"サムネイルキャッシュの整理に失敗しました: {e}")
+
+    def _evict_over_limit(self) -> None:
+        """上限を超えた分を古い順に索引から外してファイルを削除する（ロックを取得して呼び出す）"""
+        while len(self._index) > self.max_entries:
+            key, _ = self._index.popitem(last=False)
+            self._dirty = True
+            self._remove_file(key)
+
+    def _discard(self, key: str) -> None:
+        """無効になったエントリを削除する"""
+        with self._lock:
+            if self._index.pop(key, None) is None:
+                return
+            self._dirty = True
+        self._remove_file(key)
 
-        # 水平線
-        for row in range(rows + 1):
-            y = page_height - row * row_height_pt
-            pdf.line(0, y, page_width, y)
+    def _remove_file(self, key: str) -> None:
+        try:
+            (self.cache_dir / f"{key}.png").unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"サムネイルキャッシュの削除に失敗しました: {key}, エラー: {e}")
+
+    @staticmethod
+    def _key(img_path: str, params: Tuple) -> str:
+        return hashlib.sha1(repr((os.path.abspath(img_path), params)).encode('utf-8')).hexdigest()
+
+    def load(self, img_path: str, params: Tuple) -> Optional[QImage]:
+        """キャッシュ済みのサムネイルを返す（無い場合や元画像が更新されている場合は None）"""
+        try:
+            key = self._key(img_path, params)
+            with self._lock:
+                stored_mtime = self._index.get(key)
+            if stored_mtime is None:
+                return None
+            try:
+                current_mtime = os.stat(img_path).st_mtime_ns
+            except OSError:
+                current_mtime = None
+            image = QImage(str(self.cache_dir / f"{key}.png")) if stored_mtime == current_mtime else None
+            if image is None or image.isNull():
+                # 元画像が更新・削除された場合やファイルが読めない場合は、エントリごと削除する
+                self._discard(key)
+                return None
+            with self._lock:
+                if key in self._index:
+                    self._index.move_to_end(key)
+                    self._dirty = True
+            return image
+        except OSError:
+            return None
+
+    def store(self, img_path: str, params: Tuple, image: QImage) -> None:
+        """サムネイルをキャッシュに保存する"""
+        try:
+            key = self._key(img_path, params)
+            mtime = os.stat(img_path).st_mtime_ns
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(self.cache_dir / f"{key}.png"), "PNG"):
+                raise OSError("PNGの書き込みに失敗しました")
+            with self._lock:
+                self._index[key] = mtime
+                self._index.move_to_end(key)
+                self._dirty = True
+                self._evict_over_limit()
+        except OSError as e:
+            logger.error(f"サムネイルキャッシュの保存に失敗しました: {img_path}, エラー: {e}")
+
+    def save_index(self) -> None:
+        """索引をファイルに書き出す（一時ファイルに書き込んでから置き換える）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._index).encode('utf-8')
+            self._dirty = False
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.error(f"サムネイルキャッシュの索引の保存に失敗しました: {e}")
+
+
+class ImageLoadSignals(QObject):
+    """LoadImageTask の完了通知用シグナル（QRunnable はシグナルを持てないため分離）"""
+    loaded = pyqtSignal(int, str, object, object, str)  # 読み込み番号, パス, PIL Image, サムネイルのQImage, 内容のキー
+
+
+class LoadImageTask(QRunnable):
+    """画像の読み込みとサムネイル作成を行うワーカー（QThreadPool で実行）"""
+
+    def __init__(self, load_id: int, file_path: str, target_size: Tuple[int, int],
+                 image_processor: ImageProcessor, disk_cache: Optional[ThumbnailDiskCache] = None,
+                 cache_params: Tuple = (), content_key: str = '', compare_path: Optional[str] = None,
+                 psd_layer_index: Optional[int] = None):
+        super().__init__()
+        self.load_id = load_id
+        self.file_path = file_path
+        self.target_size = target_size
+        self.image_processor = image_processor
+        self.disk_cache = disk_cache
+        self.cache_params = cache_params
+        self.content_key = content_key  # 先頭部分とサイズによる内容のキー
+        self.compare_path = compare_path  # 内容のキーが一致した読み込み済みのパス
+        self.psd_layer_index = psd_layer_index
+        self.signals = ImageLoadSignals()
+
+    def run(self) -> None:
+        img = None
+        thumbnail = None
+        content_key = self.content_key
+        try:
+            # 先頭部分とサイズのキーが一致した場合は、ファイル全体を比較して同じ内容か確認する
+            if self.compare_path is not None:
+                full_key = ImageGridApp._content_hash(self.file_path, self.psd_layer_index, full=True)
+                if full_key == ImageGridApp._content_hash(self.compare_path, self.psd_layer_index, full=True):
+                    # 同じ内容なので処理せず、読み込み済みの画像を共有してもらう
+                    self.signals.loaded.emit(self.load_id, self.file_path, None, None, content_key)
+                    return
+                logger.info(f"先頭部分が同じで内容の異なる画像のため、ファイル全体のキーを使用します: {self.file_path}")
+                content_key = full_key
+
+            # ディスクキャッシュにあれば画像の処理を省略する（PIL Imageは必要になった時に再処理する）
+            if self.disk_cache is not None:
+                thumbnail = self.disk_cache.load(self.file_path, self.cache_params)
+                if thumbnail is not None:
+                    logger.info(f"サムネイルをディスクキャッシュから読み込み: {self.file_path}")
+                    self.signals.loaded.emit(self.load_id, self.file_path, None, thumbnail, content_key)
+                    return
+
+            img = self.image_processor.process_image(self.file_path, self.target_size, preview_mode=True)
+            if img is not None:
+                # QPixmapはGUIスレッド専用のため、ここではQImageまで作成する
+                thumbnail = ImageGridApp._make_thumbnail_image(img)
+                if self.disk_cache is not None:
+                    self.disk_cache.store(self.file_path, self.cache_params, thumbnail)
+        except Exception as e:
+            logger.error(f"画像の読み込み中にエラーが発生しました: {self.file_path}, エラー: {e}")
+            img = None
+            thumbnail = None
+        self.signals.loaded.emit(self.load_id, self.file_path, img, thumbnail, content_key)
 
 
 class ImageGridApp(QMainWindow):
@@ -529,7 +965,27 @@ class ImageGridApp(QMainWindow):
         super().__init__()
         self.image_paths: List[str] = []
         self.image_processor = ImageProcessor()  # ImageProcessorのインスタンスを作成
-        self.processed_images_cache: Dict[str, Image.Image] = {} # 画像キャッシュを追加 # 追記
+        # 処理済み画像のLRUキャッシュ（上限を超えたら最も古いものを破棄し、必要時に再処理する）
+        # 同じ内容の画像を別のパスで追加しても1つ分だけ保持するよう、キャッシュは内容のキーで引く
+        self.path_to_hash: Dict[str, str] = {}  # 画像パス -> 内容のキー（ファイル内容のハッシュ）
+        self.processed_images_cache: 'OrderedDict[str, Image.Image]' = OrderedDict()  # 内容のキー -> 処理済み画像
+        self.thumbnail_cache: Dict[Tuple[str, Tuple[int, int]], QPixmap] = {}  # (内容のキー, サイズ) -> サムネイル
+        # セルサイズに縮小済みの画像は QPixmapCache（プロセス全体で共有されるLRU）に保持する
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), SCALED_CACHE_LIMIT_KB))
+        self.preview_items: List[QGraphicsPixmapItem] = []  # セルごとの画像アイテム（更新時は再利用する）
+        # プレビュー描画用の画像情報（image_paths と同じ並びで位置インデックスで参照する）
+        self.pixmaps: List[Optional[QPixmap]] = []  # セルサイズに縮小済みの画像
+        self.img_sizes = np.zeros((0, 2), dtype=np.uint32)  # 縮小済み画像の (幅, 高さ)
+        self.img_offsets = np.zeros((0, 2), dtype=np.float32)  # セル左上から画像左上までのオフセット (x, y)
+        # バックグラウンド読み込みの状態（投入順に反映するためのキューと完了済みの結果）
+        self._next_load_id = 0
+        self._load_queue: List[int] = []
+        self._loaded_results: Dict[int, Tuple[str, Optional[Image.Image], Optional[QImage]]] = {}
+        self.thumbnail_disk_cache = ThumbnailDiskCache()  # 再起動後も使うサムネイルのキャッシュ
+        # 連続した更新要求をまとめ、最後の要求から一定時間後に一度だけプレビューを再構築する
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.timeout.connect(self._do_update_preview)
         try:
             self.settings = GridSettings.load_from_file()  # 設定を読み込み
         except Exception as e:
@@ -540,7 +996,6 @@ class ImageGridApp(QMainWindow):
                 "設定読み込みエラー",
                 "設定ファイルの読み込みに失敗しました。\nデフォルト設定で起動します。"
             )
-        self.preview_labels: List[QLabel] = []
         self.pdf_thread: Optional[PDFGenerationThread] = None
         self.progress_dialog: Optional[QProgressDialog] = None
 
@@ -643,15 +1098,12 @@ class ImageGridApp(QMainWindow):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # 設定ファイルのバックアップを作成
-                if os.path.exists(SETTINGS_FILE):
-                    backup_path = f"{SETTINGS_FILE}.backup"
-                    import shutil
-                    shutil.copy2(SETTINGS_FILE, backup_path)
-
-                # 設定ファイルを削除
-                if os.path.exists(SETTINGS_FILE):
-                    os.remove(SETTINGS_FILE)
+                # 設定ファイルをバックアップとしてリネーム（存在しない場合は何もしない）
+                settings_path = Path(SETTINGS_FILE)
+                try:
+                    settings_path.replace(settings_path.with_name(f"{settings_path.name}.backup"))
+                except FileNotFoundError:
+                    pass
 
                 # デフォルト設定を再読み込み
                 self.settings = GridSettings()
@@ -694,6 +1146,8 @@ class ImageGridApp(QMainWindow):
         self.row_height_spinbox.setRange(10.0, 297.0)
         self.row_height_spinbox.setValue(self.settings.row_height_mm)
         self.row_height_spinbox.setSuffix(" mm")
+        # 入力中の1文字ごとではなく、確定時（Enter・フォーカス移動・矢印操作）にだけ更新する
+        self.row_height_spinbox.setKeyboardTracking(False)
         self.row_height_spinbox.valueChanged.connect(self.update_grid)
         layout.addWidget(QLabel("行の高さ:"))
         layout.addWidget(self.row_height_spinbox)
@@ -703,6 +1157,7 @@ class ImageGridApp(QMainWindow):
         self.col_width_spinbox.setRange(10.0, 210.0)
         self.col_width_spinbox.setValue(self.settings.col_width_mm)
         self.col_width_spinbox.setSuffix(" mm")
+        self.col_width_spinbox.setKeyboardTracking(False)
         self.col_width_spinbox.valueChanged.connect(self.update_grid)
         layout.addWidget(QLabel("列の幅:"))
         layout.addWidget(self.col_width_spinbox)
@@ -744,6 +1199,7 @@ class ImageGridApp(QMainWindow):
         self.grid_width_spinbox = QSpinBox()
         self.grid_width_spinbox.setRange(1, 5)
         self.grid_width_spinbox.setValue(self.settings.grid_width)
+        self.grid_width_spinbox.setKeyboardTracking(False)
         self.grid_width_spinbox.valueChanged.connect(self.update_grid)
         layout.addWidget(QLabel("線の太さ:"))
         layout.addWidget(self.grid_width_spinbox)
@@ -778,6 +1234,41 @@ class ImageGridApp(QMainWindow):
         self.preview_area_scroll.setWidgetResizable(True)
         layout.addWidget(self.preview_area_scroll)
 
+        # 画像がない場合の案内メッセージ（作り直さずに表示・非表示を切り替える）
+        self.preview_message_label = QLabel("画像をドラッグ＆ドロップするか、\n「画像を追加」ボタンで画像を選択してください。")
+        self.preview_message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.preview_message_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 14px;
+                padding: 20px;
+                background-color: #f5f5f5;
+                border: 2px dashed #cccccc;
+                border-radius: 5px;
+            }
+        """)
+        self.preview_area_grid.addWidget(self.preview_message_label, 0, 0)
+
+        # プレビュー用のシーンとビュー（用紙を模したビュー、再描画はシーングラフに任せる）
+        self.preview_scene = QGraphicsScene(self)
+        self.preview_view = QGraphicsView(self.preview_scene)
+        self.preview_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.preview_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.preview_view.setStyleSheet("""
+            QGraphicsView {
+                background-color: white;
+                border: 1px solid #cccccc;
+                border-radius: 2px;
+            }
+        """)
+        self.preview_view.hide()
+        self.preview_area_grid.addWidget(self.preview_view, 0, 0)
+
+        # グリッド線は1つのパスアイテムにまとめ、画像アイテムより手前に表示する
+        self.preview_grid_item = QGraphicsPathItem()
+        self.preview_grid_item.setZValue(1)
+        self.preview_scene.addItem(self.preview_grid_item)
+
     def load_images(self):
         # ... (load_images() メソッド - processed_images_cache にキャッシュ)
         """画像ファイルを選択して読み込む"""
@@ -792,34 +1283,124 @@ class ImageGridApp(QMainWindow):
         )
 
         if files:
-            # 各ファイルを処理
-            for file_path in files:
-                try:
-                    # 画像を読み込んで検証
-                    img = self.image_processor.process_image(
-                        file_path,
-                        (int(self.settings.col_width_mm), int(self.settings.row_height_mm))
-                    )
-                    if img is not None:
-                        self.image_paths.append(file_path)
-                        self.processed_images_cache[file_path] = img # キャッシュ # 追記
-                    else:
-                        QMessageBox.warning(
-                            self,
-                            "警告",
-                            f"画像の読み込みに失敗しました: {file_path}"
-                        )
-                except Exception as e:
-                    logger.error(f"画像の読み込み中にエラーが発生しました: {file_path}, エラー: {e}")
-                    QMessageBox.warning(
-                        self,
-                        "エラー",
-                        f"画像の読み込み中にエラーが発生しました: {file_path}\n{str(e)}"
-                    )
-
-            # プレビューを一度だけ更新
+            # 画像の読み込みはバックグラウンドで行う
+            self._load_images_async(files)
+
+    def _load_images_async(self, file_paths: List[str]) -> None:
+        """画像の読み込みとサムネイル作成をスレッドプールで実行する"""
+        target_size = (int(self.settings.col_width_mm), int(self.settings.row_height_mm))
+        for file_path in file_paths:
+            try:
+                # PSDファイルはGUIスレッドで先にレイヤーを選択しておく
+                if not self._select_psd_layer(file_path):
+                    continue
+            except Exception as e:
+                logger.error(f"画像の読み込み中にエラーが発生しました: {file_path}, エラー: {e}")
+                QMessageBox.warning(
+                    self,
+                    "エラー",
+                    f"画像の読み込み中にエラーが発生しました: {file_path}\n{str(e)}"
+                )
+                continue
+
+            # 追加した順序で反映するため、投入順に番号を振っておく
+            load_id = self._next_load_id
+            self._next_load_id += 1
+            self._load_queue.append(load_id)
+
+            # 同じパスの画像が読み込み済みなら、処理せずにそのサムネイルを共有する
+            psd_layer_index = self.image_processor.psd_layer_indices.get(file_path)
+            content_key = self._content_hash(file_path, psd_layer_index)
+            if (self.path_to_hash.get(file_path) == content_key
+                    and (content_key, THUMBNAIL_SIZE) in self.thumbnail_cache):
+                logger.info(f"同じ画像が読み込み済みのため共有します: {file_path}")
+                self._loaded_results[load_id] = (file_path, None, None)
+                continue
+            # 別のパスとキーが一致した場合は、同じ内容かどうかをワーカーでファイル全体から確認する
+            # （先頭部分とサイズだけのキーは末尾だけが異なる画像で衝突しうる）
+            compare_path = next((path for path, key in self.path_to_hash.items()
+                                 if key == content_key and path != file_path), None)
+            if compare_path is None:
+                self.path_to_hash[file_path] = content_key
+
+            # サムネイルの内容を左右する処理条件（ディスクキャッシュのキーに使用）
+            cache_params = (
+                THUMBNAIL_SIZE,
+                target_size,
+                self.image_processor.cmyk_profile_path,
+                self.image_processor.color_conversion_intent,
+                self.image_processor.psd_layer_indices.get(file_path),
+            )
+            task = LoadImageTask(load_id, file_path, target_size, self.image_processor,
+                                 self.thumbnail_disk_cache, cache_params,
+                                 content_key, compare_path, psd_layer_index)
+            task.signals.loaded.connect(self._on_image_loaded)
+            QThreadPool.globalInstance().start(task)
+
+        # すべて読み込み済みの画像と同じ内容だった場合はここで反映する
+        self._apply_loaded_results()
+
+    def _on_image_loaded(self, load_id: int, file_path: str, img: Optional[Image.Image],
+                         thumbnail: Optional[QImage], content_key: str) -> None:
+        """ワーカーでの読み込み完了時の処理（GUIスレッドで実行される）"""
+        # ワーカーでファイル全体を比較した結果のキーを反映する
+        self.path_to_hash[file_path] = content_key
+        self._loaded_results[load_id] = (file_path, img, thumbnail)
+        self._apply_loaded_results()
+
+    def _apply_loaded_results(self) -> None:
+        """先頭から順に、読み込みが終わったものだけを反映する"""
+        if not self._load_queue:
+            return
+        while self._load_queue and self._load_queue[0] in self._loaded_results:
+            path, loaded_img, loaded_thumbnail = self._loaded_results.pop(self._load_queue.pop(0))
+            thumbnail_key = (self._content_key(path), THUMBNAIL_SIZE)
+            if thumbnail_key in self.thumbnail_cache:
+                # 同じ内容の画像が先に読み込まれていれば、そのサムネイルと処理済み画像を共有する
+                self.image_paths.append(path)
+                continue
+            if loaded_img is None and loaded_thumbnail is None:
+                QMessageBox.warning(
+                    self,
+                    "警告",
+                    f"画像の読み込みに失敗しました: {path}"
+                )
+                continue
+            self.image_paths.append(path)
+            # QPixmapはGUIスレッドでのみ作成できる
+            pixmap = QPixmap.fromImage(loaded_thumbnail) if loaded_thumbnail is not None else None
+            if loaded_img is not None:
+                self._cache_processed_image(path, loaded_img, pixmap)
+            else:
+                # ディスクキャッシュから読み込んだ場合はサムネイルのみ登録する
+                self.thumbnail_cache[thumbnail_key] = pixmap
+
+        # 投入した読み込みがすべて終わったらプレビューを一度だけ更新
+        if not self._load_queue:
+            self.thumbnail_disk_cache.save_index()
             self.update_preview()
 
+    def _select_psd_layer(self, file_path: str) -> bool:
+        """PSDファイルの場合はレイヤー選択ダイアログを表示し、選択結果を保存する
+
+        PSD以外のファイルは常に True を返す。キャンセルされた場合は False を返す。
+        """
+        if not (file_path.lower().endswith('.psd') and PSD_SUPPORT):
+            return True
+
+        layers = ImageProcessor._list_psd_layers(file_path)
+        dialog = PSDLayerDialog(layers, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            logger.info("レイヤー選択がキャンセルされました")
+            return False
+
+        selected_index = dialog.get_selected_layer_index()
+        if selected_index is None:
+            return False
+        logger.info(f"選択されたレイヤー: {selected_index}")
+        self.image_processor.psd_layer_indices[file_path] = selected_index
+        return True
+
     def update_grid(self):
         # ... (update_grid() メソッド - 変更なし)
         """グリッド設定を更新"""
@@ -842,79 +1423,128 @@ class ImageGridApp(QMainWindow):
             self.col_width_spinbox.setRange(10.0, 297.0)   # A3の幅制限
         self.update_preview()
 
-    @lru_cache(maxsize=100)
-    def _create_thumbnail(self, img_path: str) -> QPixmap: # 引数を img_path から img に変更 # 変更
-        """画像のサムネイルを生成（キャッシュ付き）"""
+    @staticmethod
+    def _content_hash(file_path: str, psd_layer_index: Optional[int] = None,
+                      full: bool = False) -> str:
+        """同一画像の判定に使う内容のキー（先頭部分とファイルサイズのBLAKE2b、読めない場合はパス）
+
+        full=True の場合はファイル全体のBLAKE2bを使う（大きなファイルも全体を読むため LoadImageTask から呼び出す）。
+        PSDは選択したレイヤーによって内容が変わるため、レイヤー番号もキーに含める。
+        """
         try:
-            # キャッシュから PIL Image を取得 # 変更
-            img = self.processed_images_cache.get(img_path)
-            if img is None: # 念のため None チェック
-                logger.error(f"キャッシュミス: {img_path}")
-                return QPixmap()
-
-            # PIL ImageをQPixmapに変換 (RGB変換は ImageProcessor.process_image() で行うように変更)
-            data = img.convert('RGB').tobytes("raw", "RGB") # RGB 変換を明示的に
-            qim = QImage(data, img.size[0], img.size[1], QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(qim)
-
-            # サムネイルサイズにリサイズ
-            thumbnail = pixmap.scaled(THUMBNAIL_SIZE[0], THUMBNAIL_SIZE[1],
-                                    Qt.AspectRatioMode.KeepAspectRatio,
-                                    Qt.TransformationMode.SmoothTransformation)
-            return thumbnail
+            with open(file_path, 'rb') as f:
+                if full:
+                    digest = hashlib.blake2b(digest_size=8)
+                    for chunk in iter(lambda: f.read(CONTENT_HASH_HEAD_BYTES), b''):
+                        digest.update(chunk)
+                else:
+                    digest = hashlib.blake2b(f.read(CONTENT_HASH_HEAD_BYTES), digest_size=8)
+                    digest.update(os.fstat(f.fileno()).st_size.to_bytes(8, 'little'))
+        except OSError:
+            return file_path
+        key = digest.hexdigest()
+        return key if psd_layer_index is None else f"{key}:{psd_layer_index}"
+
+    def _content_key(self, img_path: str) -> str:
+        """画像パスに対応するキャッシュのキー（ハッシュ未計算のパスはパス自体を使う）"""
+        return self.path_to_hash.get(img_path, img_path)
+
+    def _cache_processed_image(self, img_path: str, img: Image.Image,
+                               thumbnail: Optional[QPixmap] = None) -> None:
+        """処理済み画像をキャッシュに追加し、上限を超えた分を古い順に破棄する"""
+        key = self._content_key(img_path)
+        self.processed_images_cache[key] = img
+        self.processed_images_cache.move_to_end(key)
+        # 描画時に変換しないよう、サムネイルもここで作成しておく（再処理時は作り直す）
+        if thumbnail is None:
+            thumbnail = self._create_thumbnail(img)
+        self.thumbnail_cache[(key, THUMBNAIL_SIZE)] = thumbnail
+        while len(self.processed_images_cache) > PROCESSED_IMAGE_CACHE_SIZE:
+            evicted_key, _ = self.processed_images_cache.popitem(last=False)
+            logger.info(f"処理済み画像をキャッシュから破棄: {evicted_key}")
+
+    def _get_processed_image(self, img_path: str) -> Optional[Image.Image]:
+        """処理済み画像を取得（キャッシュから破棄されている場合は再処理する）"""
+        key = self._content_key(img_path)
+        img = self.processed_images_cache.get(key)
+        if img is not None:
+            self.processed_images_cache.move_to_end(key)
+            return img
+
+        img = self.image_processor.process_image(
+            img_path,
+            (int(self.settings.col_width_mm), int(self.settings.row_height_mm)),
+            preview_mode=True
+        )
+        if img is not None:
+            self._cache_processed_image(img_path, img)
+        return img
+
+    @staticmethod
+    def _make_thumbnail_image(img: Image.Image) -> QImage:
+        """PIL Imageからサムネイル用のQImageを生成（QPixmapを使わないためワーカースレッドからも呼べる）"""
+        # QImageに渡す前にPILで縮小しておく（大きな画像の画素をQt側に渡さない）
+        if img.width > THUMBNAIL_SIZE[0] or img.height > THUMBNAIL_SIZE[1]:
+            img = img.copy()
+            img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+        # 既にRGB/RGBAの場合は変換せずにそのまま使う
+        if img.mode == 'RGBA':
+            arr = np.asarray(img)  # HxWx4 uint8, C連続
+            image_format = QImage.Format.Format_RGBA8888
+        else:
+            arr = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))  # HxWx3 uint8, C連続
+            image_format = QImage.Format.Format_RGB888
+        qim = QImage(arr.data, arr.shape[1], arr.shape[0], arr.strides[0], image_format)
+        # qim は arr を参照しているため、関数を抜ける前に自前のバッファへコピーする（サムネイルなので小さい）
+        return qim.copy()
+
+    def _create_thumbnail(self, img: Image.Image) -> QPixmap:
+        """処理済み画像からプレビュー用のサムネイルを生成"""
+        try:
+            return QPixmap.fromImage(self._make_thumbnail_image(img))
         except Exception as e:
-            logger.error(f"サムネイルの生成に失敗しました: {img_path}, エラー: {e}")
+            logger.error(f"サムネイルの生成に失敗しました: {e}")
             return QPixmap()
 
+    def _get_thumbnail(self, img_path: str) -> Optional[QPixmap]:
+        """サムネイルを取得（読み込み時に作成済みのものを返し、無い場合のみ作成する）"""
+        key = (self._content_key(img_path), THUMBNAIL_SIZE)
+        thumbnail = self.thumbnail_cache.get(key)
+        if thumbnail is None:
+            img = self._get_processed_image(img_path)
+            if img is None:
+                logger.error(f"キャッシュミス: {img_path}")
+                return None
+            # _get_processed_image が再処理した場合は既に作成済み
+            thumbnail = self.thumbnail_cache.get(key)
+            if thumbnail is None:
+                thumbnail = self.thumbnail_cache[key] = self._create_thumbnail(img)
+        return thumbnail
 
     def update_preview(self):
+        """プレビューの更新を予約（短時間に連続した呼び出しは一度の更新にまとめる）"""
+        self._preview_debounce.start(PREVIEW_DEBOUNCE_MS)
+
+    def _do_update_preview(self):
         # ... (update_preview() メソッド - _create_thumbnail() 呼び出しを修正)
         """プレビューを更新"""
         try:
-            # 既存のプレビューをクリア
-            for label in self.preview_labels:
-                label.clear()
-                label.setParent(None)
-            self.preview_labels = []
-
-            # グリッドコンテナのクリア
-            while self.preview_area_grid.count():
-                item = self.preview_area_grid.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
             if not self.image_paths:
                 # 画像がない場合は初期メッセージを表示
-                message_label = QLabel("画像をドラッグ＆ドロップするか、\n「画像を追加」ボタンで画像を選択してください。")
-                message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                message_label.setStyleSheet("""
-                    QLabel {
-                        color: #666666;
-                        font-size: 14px;
-                        padding: 20px;
-                        background-color: #f5f5f5;
-                        border: 2px dashed #cccccc;
-                        border-radius: 5px;
-                    }
-                """)
-                self.preview_area_grid.addWidget(message_label)
+                self.preview_view.hide()
+                self.preview_message_label.show()
                 return
+            self.preview_message_label.hide()
 
             # プレビューのサイズを計算（A4/A3の比率を保持）
             preview_height = DEFAULT_PREVIEW_HEIGHT
             preview_width = int(preview_height * (self.settings.page_size[0] / self.settings.page_size[1]))
 
-            # プレビュー用のフレームを作成（用紙を模したフレーム）
-            self.preview_frame = QFrame()
-            self.preview_frame.setFixedSize(preview_width, preview_height)
-            self.preview_frame.setFrameShape(QFrame.Shape.Box)
-            self.preview_frame.setStyleSheet("""
-                QFrame {
-                    background-color: white;
-                    border: 1px solid #cccccc;
-                    border-radius: 2px;
-                }
-            """)
+            # プレビュー用のビューを用紙サイズに合わせる
+            self.preview_scene.setSceneRect(0, 0, preview_width, preview_height)
+            frame_width = 2 * self.preview_view.frameWidth()
+            self.preview_view.setFixedSize(preview_width + frame_width, preview_height + frame_width)
 
             # 行と列の数を計算
             col_width_pt = self.settings.col_width_mm * MM_TO_PT
@@ -926,77 +1556,16 @@ class ImageGridApp(QMainWindow):
             cell_width = preview_width / (self.settings.page_size[0] / col_width_pt)
             cell_height = preview_height / (self.settings.page_size[1] / row_height_pt)
 
-            # 画像を描画するためのpaintEventを設定
-            def paint_preview(event):
-                painter = QPainter(self.preview_frame)
-                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            # セルサイズに縮小済みの画像を用意（描画時は拡大縮小せずにそのまま配置する）
+            cell_w, cell_h = max(1, int(cell_width)), max(1, int(cell_height))
+            self._build_preview_arrays(cell_w, cell_h)
+            self._compute_preview_offsets(cell_width, cell_height)
 
-                try:
-                    # 画像の描画
-                    for row in range(rows):
-                        for col in range(cols):
-                            cell_index = row * cols + col
-                            img_index = cell_index % len(self.image_paths) if self.image_paths else 0
-
-                            if self.image_paths:
-                                img_path = self.image_paths[img_index]
-                                # キャッシュから Image.Image オブジェクトを取得 # 変更
-                                img = self.processed_images_cache.get(img_path)
-                                if img is None: # 念のため None チェック
-                                    logger.error(f"キャッシュミス (paintEvent): {img_path}")
-                                    continue # キャッシュミス時はスキップ
-
-                                thumbnail = self._create_thumbnail(img_path) # _create_thumbnail に img ではなく img_path を渡す (キャッシュキーとして使用)
-
-                                # セルのサイズとアスペクト比を計算
-                                cell_rect_width = cell_width
-                                cell_rect_height = cell_height
-                                cell_aspect = cell_rect_width / cell_rect_height
-
-                                # 画像のアスペクト比を計算
-                                img_aspect = thumbnail.width() / thumbnail.height()
-
-                                # アスペクト比に基づいてサイズを調整
-                                if img_aspect > cell_aspect:
-                                    new_width = cell_rect_width
-                                    new_height = cell_rect_width / img_aspect
-                                else:
-                                    new_height = cell_rect_height
-                                    new_width = cell_rect_height * img_aspect
-
-                                # セル内での位置を計算（センタリング）
-                                x = col * cell_width + (cell_width - new_width) / 2
-                                y = row * cell_height + (cell_height - new_height) / 2
-
-                                # 画像を描画
-                                target_rect = QRectF(x, y, new_width, new_height)
-                                source_rect = QRectF(thumbnail.rect())
-                                painter.drawPixmap(target_rect, thumbnail, source_rect)
-
-                    # グリッド線の描画
-                    if self.settings.grid_line_visible:
-                        pen = QPen(self.settings.grid_color)
-                        pen.setWidth(self.settings.grid_width)
-                        painter.setPen(pen)
-
-                        # 垂直線
-                        for col in range(cols + 1):
-                            x = col * cell_width
-                            painter.drawLine(int(x), 0, int(x), preview_height)
-
-                        # 水平線
-                        for row in range(rows + 1):
-                            y = row * cell_height
-                            painter.drawLine(0, int(y), preview_width, int(y))
-                finally:
-                    painter.end()
-
-            # paintEventを設定
-            self.preview_frame.paintEvent = paint_preview
-
-            # プレビューフレームをレイアウトに追加
-            self.preview_area_grid.addWidget(self.preview_frame)
-            self.preview_frame.update()
+            # 既存のアイテムの画像と位置を更新するだけにする（再描画範囲はQtが管理する）
+            self._layout_preview_items(rows, cols, cell_width, cell_height)
+            self._update_preview_grid_item(preview_width, preview_height, rows, cols,
+                                           cell_width, cell_height)
+            self.preview_view.show()
 
         except Exception as e:
             logger.error(f"プレビューの更新中にエラーが発生しました: {e}", exc_info=True)
@@ -1006,6 +1575,108 @@ class ImageGridApp(QMainWindow):
                 f"プレビューの更新中にエラーが発生しました: {str(e)}"
             )
 
+    def _build_preview_arrays(self, cell_w: int, cell_h: int) -> None:
+        """image_paths と同じ並びで縮小済み画像とそのサイズの配列を作る"""
+        pixmaps: List[Optional[QPixmap]] = []
+        bucket_w, bucket_h = self._scaled_bucket(cell_w), self._scaled_bucket(cell_h)
+        for img_path in self.image_paths:
+            thumbnail = self._get_thumbnail(img_path)
+            if thumbnail is None:
+                logger.error(f"キャッシュミス (プレビュー描画): {img_path}")
+                pixmaps.append(None)
+                continue
+            # サムネイルが作り直されると cacheKey が変わるので、古い縮小画像は自然に使われなくなる
+            key = f"{thumbnail.cacheKey()}|{bucket_w}x{bucket_h}"
+            scaled = QPixmapCache.find(key)
+            if scaled is None:
+                # 軽い縮小なら最近傍補間で十分（大きく縮小する場合はエイリアシング、
+                # 拡大する場合はブロック状のノイズを防ぐため補間する）
+                scale = min(bucket_w / thumbnail.width(), bucket_h / thumbnail.height())
+                near_same_size = 1 / PREVIEW_FAST_SCALE_RATIO <= scale <= 1
+                scaled = thumbnail.scaled(
+                    bucket_w, bucket_h,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.FastTransformation if near_same_size
+                    else Qt.TransformationMode.SmoothTransformation
+                )
+                QPixmapCache.insert(key, scaled)
+            pixmaps.append(scaled)
+
+        sizes = np.array([(p.width(), p.height()) if p is not None else (0, 0) for p in pixmaps],
+                         dtype=np.uint32).reshape(-1, 2)
+        self.pixmaps = pixmaps
+        self.img_sizes = sizes
+
+    @staticmethod
+    def _scaled_bucket(size: int) -> int:
+        """セルサイズを刻みに丸める（小さいセルはそのまま使う）"""
+        if size < SCALED_CACHE_BUCKET_PX:
+            return max(1, size)
+        return (size // SCALED_CACHE_BUCKET_PX) * SCALED_CACHE_BUCKET_PX
+
+    def _compute_preview_offsets(self, cell_width: float, cell_height: float) -> None:
+        """縮小済み画像をセルの中央に置くための配置オフセットを全画像まとめて計算する
+
+        縮小済み画像は刻みに丸めたサイズで作られるため、セルサイズではなく実際の画像サイズから求める。
+        """
+        self.img_offsets = np.stack(
+            [(cell_width - self.img_sizes[:, 0]) / 2, (cell_height - self.img_sizes[:, 1]) / 2], axis=1
+        ).astype(np.float32).reshape(-1, 2)
+
+    def _layout_preview_items(self, rows: int, cols: int,
+                              cell_width: float, cell_height: float) -> None:
+        """セルごとの画像アイテムを必要数だけ用意し、画像と位置を設定する（アイテムは作り直さない）"""
+        num_cells = rows * cols
+        while len(self.preview_items) < num_cells:
+            item = QGraphicsPixmapItem()
+            # セルサイズに縮小済みの画像を等倍で配置するため、補間は不要
+            item.setTransformationMode(Qt.TransformationMode.FastTransformation)
+            self.preview_scene.addItem(item)
+            self.preview_items.append(item)
+        # 余ったアイテムは削除せずに隠しておく（セル数が増えたときに再利用する）
+        for item in self.preview_items[num_cells:]:
+            item.setVisible(False)
+
+        # セルの左上座標と各セルに割り当てる画像の位置インデックスを配列でまとめて求める
+        num_images = len(self.pixmaps)
+        img_idx = np.arange(num_cells) % num_images
+        xs = (np.tile(np.arange(cols) * cell_width, rows) + self.img_offsets[img_idx, 0]).tolist()
+        ys = (np.repeat(np.arange(rows) * cell_height, cols) + self.img_offsets[img_idx, 1]).tolist()
+
+        for item, i, x, y in zip(self.preview_items, img_idx.tolist(), xs, ys):
+            pixmap = self.pixmaps[i]
+            if pixmap is None:
+                item.setVisible(False) # キャッシュミス時はスキップ
+                continue
+            # 同じ画像なら setPixmap を省略して再描画を抑える
+            if item.pixmap().cacheKey() != pixmap.cacheKey():
+                item.setPixmap(pixmap)
+            item.setPos(x, y)
+            item.setVisible(True)
+
+    def _update_preview_grid_item(self, preview_width: int, preview_height: int, rows: int, cols: int,
+                                  cell_width: float, cell_height: float) -> None:
+        """グリッド線のパスアイテムを更新する（垂直線と水平線を1つのパスにまとめる）"""
+        if not self.settings.grid_line_visible:
+            self.preview_grid_item.setVisible(False)
+            return
+
+        grid_path = QPainterPath()
+        for col in range(cols + 1):
+            x = int(col * cell_width)
+            grid_path.moveTo(x, 0)
+            grid_path.lineTo(x, preview_height)
+        for row in range(rows + 1):
+            y = int(row * cell_height)
+            grid_path.moveTo(0, y)
+            grid_path.lineTo(preview_width, y)
+
+        pen = QPen(self.settings.grid_color)
+        pen.setWidth(self.settings.grid_width)
+        self.preview_grid_item.setPen(pen)
+        self.preview_grid_item.setPath(grid_path)
+        self.preview_grid_item.setVisible(True)
+
     def select_grid_color(self):
         # ... (select_grid_color() メソッド - 変更なし)
         """グリッド線の色を選択するダイアログを表示"""
@@ -1052,6 +1723,9 @@ class ImageGridApp(QMainWindow):
             logger.info(f"色変換方法を設定: {self.image_processor.color_conversion_intent}")
             self.pdf_thread.set_color_conversion_intent(self.image_processor.color_conversion_intent)
 
+            # 選択済みのPSDレイヤーを渡す（合成はスレッド側で行う）
+            self.pdf_thread.set_psd_layer_indices(self.image_processor.psd_layer_indices)
+
             # シグナルの接続
             self.pdf_thread.finished.connect(
                 lambda temp_path, temp_dir: self.on_pdf_generation_finished(temp_path, temp_dir, file_path)
@@ -1105,39 +1779,20 @@ class ImageGridApp(QMainWindow):
     def dropEvent(self, event: QDropEvent):
         # ... (dropEvent() メソッド - processed_images_cache にキャッシュ)
         """ドラッグ＆ドロップ時のイベント処理"""
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith((".png", ".jpg", ".jpeg", ".psd", ".pdf")):
-                try:
-                    # 画像を読み込んで検証
-                    img = self.image_processor.process_image(
-                        file_path,
-                        (int(self.settings.col_width_mm), int(self.settings.row_height_mm))
-                    )
-                    if img is not None:
-                        self.image_paths.append(file_path)
-                        self.processed_images_cache[file_path] = img # キャッシュ # 追記
-                    else:
-                        QMessageBox.warning(
-                            self,
-                            "警告",
-                            f"画像の読み込みに失敗しました: {file_path}"
-                        )
-                except Exception as e:
-                    logger.error(f"画像の読み込み中にエラーが発生しました: {file_path}, エラー: {e}")
-                    QMessageBox.warning(
-                        self,
-                        "エラー",
-                        f"画像の読み込みに失敗しました: {file_path}\n{str(e)}"
-                    )
-        self.update_preview()
+        file_paths = [
+            url.toLocalFile() for url in event.mimeData().urls()
+            if os.path.splitext(url.toLocalFile())[1].lower() in SUPPORTED_EXTS
+        ]
+        # 画像の読み込みはバックグラウンドで行い、ウィンドウを固まらせない
+        self._load_images_async(file_paths)
 
     def closeEvent(self, event: Any) -> None:
         # ... (closeEvent() メソッド - 変更なし)
         """アプリケーション終了時の処理"""
         try:
             self.settings.save_to_file()  # 設定を保存
-            self._create_thumbnail.cache_clear()  # サムネイルキャッシュをクリア
+            self.thumbnail_cache.clear()  # サムネイルキャッシュをクリア
+            self.thumbnail_disk_cache.save_index()  # ディスクキャッシュの索引を保存
         except Exception as e:
             logger.error(f"設定の保存中にエラーが発生しました: {e}")
             QMessageBox.warning(self, "警告", "設定の保存に失敗しました。")
@@ -1231,9 +1886,9 @@ class ImageGridApp(QMainWindow):
 class PSDLayerDialog(QDialog):
     # ... (PSDLayerDialog クラス - 変更なし)
     """PSDレイヤー選択ダイアログ"""
-    def __init__(self, psd: psd_tools.PSDImage, parent=None):
+    def __init__(self, layers: List[PSDLayerInfo], parent=None):
         super().__init__(parent)
-        self.psd = psd
+        self.layers = layers
         self.selected_layer_index = None
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         self.initUI()
@@ -1248,12 +1903,12 @@ class PSDLayerDialog(QDialog):
         self.layer_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
 
         # レイヤー情報を追加
-        for i, layer in enumerate(self.psd):
-            layer_name = layer.name if layer.name else f"レイヤー {i+1}"
+        for layer in self.layers:
+            layer_name = layer.name if layer.name else f"レイヤー {layer.index+1}"
             visible_icon = "👁" if layer.visible else "👁‍🗨"
             size_info = f" ({layer.size[0]}x{layer.size[1]})"
             item = QListWidgetItem(f"{visible_icon} {layer_name}{size_info}")
-            item.setData(Qt.ItemDataRole.UserRole, i)  # レイヤーインデックスを保存
+            item.setData(Qt.ItemDataRole.UserRole, layer.index)  # レイヤーインデックスを保存
             self.layer_list.addItem(item)
             logger.info(f"レイヤーリストに追加: {layer_name}{size_info}")
 
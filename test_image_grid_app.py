@@ -1,8 +1,10 @@
 import os
 import sys
+import tempfile
 import unittest
 
-from PyQt6.QtCore import Qt
+from PIL import Image
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtTest import QTest
 from PyQt6.QtWidgets import QApplication
 
@@ -18,7 +20,12 @@ class TestImageGridApp(unittest.TestCase):
     def setUp(self):
         # 各テストの前にウィンドウをリセット
         self.window.image_paths = []
-        self.window.update_preview()
+        self.flush_preview()
+
+    def flush_preview(self):
+        """update_preview で予約されたプレビューの更新をイベントループを待たずに実行する"""
+        self.window._preview_debounce.stop()
+        self.window._do_update_preview()
 
     def test_01_load_images(self):
         """画像の読み込みテスト"""
@@ -37,6 +44,15 @@ class TestImageGridApp(unittest.TestCase):
         # 画像が正しく追加されたか確認
         self.assertEqual(len(self.window.image_paths), len(test_images))
 
+        # プレビューが作成され、すべての画像が配置されたか確認
+        self.flush_preview()
+        self.assertEqual(len(self.window.pixmaps), len(test_images))
+        self.assertTrue(all(pixmap is not None and not pixmap.isNull() for pixmap in self.window.pixmaps))
+        visible_items = [item for item in self.window.preview_items if item.isVisible()]
+        self.assertTrue(visible_items)
+        for item in visible_items:
+            self.assertFalse(item.pixmap().isNull())
+
     def test_02_grid_settings(self):
         """グリッド設定のテスト"""
         # 行の高さを変更
@@ -85,6 +101,11 @@ class TestImageGridApp(unittest.TestCase):
         # 存在しない画像ファイルを追加
         self.window.image_paths.append('nonexistent.png')
         self.window.update_preview()
+        self.flush_preview()
+
+        # 読み込めない画像のセルは空のまま、プレビューの作成は続行される
+        self.assertEqual(self.window.pixmaps, [None])
+        self.assertFalse(any(item.isVisible() for item in self.window.preview_items))
 
         # 無効な設定ファイルのテスト
         with open('grid_settings.json', 'w') as f:
@@ -94,6 +115,31 @@ class TestImageGridApp(unittest.TestCase):
         settings = GridSettings.load_from_file()
         self.assertIsNotNone(settings)
 
+    def test_06_content_key_collision(self):
+        """先頭部分が同じで内容の異なる画像の判定テスト"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # 無圧縮PNGで、末尾（画像の下端）だけが異なり同じサイズのファイルを作成
+            base = Image.new('RGB', (300, 300), 'red')
+            changed = base.copy()
+            changed.paste((0, 0, 255), (0, 250, 300, 300))
+            path_a = os.path.join(tmp_dir, 'a.png')
+            path_b = os.path.join(tmp_dir, 'b.png')
+            path_c = os.path.join(tmp_dir, 'c.png')
+            base.save(path_a, compress_level=0)
+            changed.save(path_b, compress_level=0)
+            base.save(path_c, compress_level=0)
+            self.assertEqual(ImageGridApp._content_hash(path_a), ImageGridApp._content_hash(path_b))
+
+            # 読み込みはワーカーで行われるため、完了を待ってからシグナルを処理する
+            self.window._load_images_async([path_a, path_b, path_c])
+            QThreadPool.globalInstance().waitForDone()
+            QTest.qWait(100)
+
+            self.assertEqual(self.window.image_paths, [path_a, path_b, path_c])
+            key_a, key_b, key_c = (self.window._content_key(p) for p in (path_a, path_b, path_c))
+            self.assertNotEqual(key_a, key_b)
+            self.assertEqual(key_a, key_c)
+
     @classmethod
     def tearDownClass(cls):
         # テスト用ファイルの削除
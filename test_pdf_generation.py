@@ -1,21 +1,80 @@
-import importlib.util
+import hashlib
+import io
 import os
-import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 from PIL import Image
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
-# テスト対象のPDF生成機能をインポート
-spec = importlib.util.spec_from_file_location("d_pj_image_grid_app_v0.02", "step_01/d_pj_image_grid_app_v0.02.py")
-module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(module)
+def compute_offsets(rows, cols, row_height_pt, page_height, num_images):
+    """行ごとのセルの画像番号と、各行の左下のY座標をまとめて計算する（センタリングは drawImage に任せる）"""
+    img_indices = (np.arange(rows * cols) % num_images).reshape(rows, cols)
+    row_y_offsets = page_height - (np.arange(rows) + 1) * row_height_pt
+    return img_indices, row_y_offsets
 
-def test_pdf_generation():
-    """PDFの実際の生成機能をテスト"""
+def count_image_xobjects(pdf_bytes):
+    """書き出したPDFに埋め込まれた画像XObjectの数を返す（ReportLabはオブジェクトの辞書を圧縮しない）"""
+    return pdf_bytes.count(b'/Subtype /Image')
+
+def prepare_jpeg(img_path, cell_width_pt, cell_height_pt):
+    """画像をセル内に収まる大きさに縮小し、CMYKのJPEGのバイト列にする"""
+    with Image.open(img_path) as img:
+        img_width, img_height = img.size
+        img_aspect = img_width / img_height
+        
+        # アスペクト比を維持したままセル内に収まるようリサイズ
+        # （リサイズ後の画素数とPDF上の描画サイズが一致するよう整数に丸める）
+        if img_aspect > cell_width_pt / cell_height_pt:
+            # 画像が横長の場合
+            new_width = cell_width_pt
+            new_height = cell_width_pt / img_aspect
+        else:
+            # 画像が縦長の場合
+            new_height = cell_height_pt
+            new_width = cell_height_pt * img_aspect
+        img = img.resize((round(new_width), round(new_height)), Image.Resampling.BILINEAR)
     
-    # テスト用の一時ディレクトリを作成
+    # CMYKに変換（印刷用のアプリと同じくCMYKのまま埋め込む）
+    # RGB/RGBA/パレットのどれでも直接変換できるので、既にCMYKでなければ1回だけ変換する
+    img_cmyk = img if img.mode == 'CMYK' else img.convert('CMYK')
+    
+    # テスト対象のアプリと同じくメモリ上でJPEGにしておく（ReportLabはJPEGをそのまま埋め込める）
+    # テスト用なので画質より速さを優先する（最適化やプログレッシブは使わず、色差は4:2:0で間引く）
+    buffer = io.BytesIO()
+    img_cmyk.save(buffer, format='JPEG', quality=60, optimize=False, subsampling=2, progressive=False)
+    return buffer.getvalue()
+
+def reader_key(img_path, cell_width_pt, cell_height_pt):
+    """準備済み画像のキャッシュのキー（画像のパスとセルの大きさ）"""
+    return (img_path, round(cell_width_pt, 1), round(cell_height_pt, 1))
+
+def form_name_for(key):
+    """準備済み画像のキャッシュのキーから、PDFの名前として使えるフォーム名を作る"""
+    return f"cell_{hashlib.sha1(repr(key).encode('utf-8')).hexdigest()}"
+
+def get_reader(cache, img_path, cell_width_pt, cell_height_pt):
+    """セルの大きさに合わせて準備した画像の ImageReader を返す（同じ条件なら cache から再利用する）
+
+    同じ ImageReader を渡すと、PDFには画像ごとに1つだけ埋め込まれて各セルから参照される。
+    """
+    key = reader_key(img_path, cell_width_pt, cell_height_pt)
+    reader = cache.get(key)
+    if reader is None:
+        reader = cache[key] = ImageReader(io.BytesIO(prepare_jpeg(img_path, cell_width_pt, cell_height_pt)))
+    return reader
+
+def test_pdf_generation(prepared_readers, pdf=None):
+    """PDFの実際の生成機能をテスト
+
+    prepared_readers は準備済み画像のキャッシュ（pytestではセッション全体で共有するフィクスチャ）。
+    pdf に既存のCanvasを渡した場合は1ページ分を追加するだけで保存しない（複数の条件を1つのPDFに
+    まとめる場合に使い、画像のXObjectはページ間で共有される）。保存は呼び出し元で行う。
+    """
+    # 出力PDF用の一時ディレクトリを作成（画像の中間ファイルはメモリ上に置き、ここには書き出さない）
     with tempfile.TemporaryDirectory() as temp_dir:
         # テスト用のパラメータ
         output_pdf = os.path.join(temp_dir, "test_output.pdf")
@@ -30,6 +89,11 @@ def test_pdf_generation():
             os.path.abspath(f'test_images/test_image_{i}.png') for i in range(1, 5)
         ]
         
+        # テスト画像の有無はここで一度だけ確認し、無ければ描画を始める前に失敗させる
+        assert test_images, "テスト画像が指定されていません"
+        missing_images = [img_path for img_path in test_images if not os.path.exists(img_path)]
+        assert not missing_images, f"テスト画像が見つかりません: {missing_images}"
+        
         # mm単位をポイントに変換 (1mm = 2.83465pt)
         MM_TO_PT = 2.83465
         page_width, page_height = page_size
@@ -44,61 +108,77 @@ def test_pdf_generation():
         print(f"行の高さ: {row_height_mm}mm, 列の幅: {col_width_mm}mm")
         print(f"計算された行数: {rows}, 列数: {cols}")
         
-        pdf = canvas.Canvas(output_pdf, pagesize=page_size)
-        
-        for row in range(rows):
-            for col in range(cols):
-                cell_index = row * cols + col
-                # 画像がない場合は最初の画像を使用（繰り返し）
-                img_index = cell_index % len(test_images) if test_images else 0
-                
-                if test_images:
-                    img_path = test_images[img_index]
-                    img = Image.open(img_path)
-                    
-                    # アスペクト比を維持したままセル内に収まるようリサイズ
-                    img_width, img_height = img.size
-                    img_aspect = img_width / img_height
-                    cell_aspect = col_width_pt / row_height_pt
-                    
-                    if img_aspect > cell_aspect:
-                        # 画像が横長の場合
-                        new_width = col_width_pt
-                        new_height = col_width_pt / img_aspect
-                    else:
-                        # 画像が縦長の場合
-                        new_height = row_height_pt
-                        new_width = row_height_pt * img_aspect
-                    
-                    # セル内でセンタリング
-                    x_offset = col * col_width_pt + (col_width_pt - new_width) / 2
-                    y_offset = page_height - (row + 1) * row_height_pt + (row_height_pt - new_height) / 2
-                    
-                    img = img.resize((int(new_width), int(new_height)))
-                    
-                    # RGBAモードの画像をCMYKモードに変換
-                    if img.mode == 'RGBA':
-                        img = img.convert('RGB')
-                    
-                    # RGBをCMYKに変換
-                    img_cmyk = img.convert('CMYK')
-                    
-                    temp_img_path = os.path.join(temp_dir, f"temp_{row}_{col}.jpg")
-                    img_cmyk.save(temp_img_path)
-                    
-                    pdf.drawImage(temp_img_path, x_offset, y_offset, new_width, new_height)
+        owns_pdf = pdf is None
+        if owns_pdf:
+            pdf = canvas.Canvas(output_pdf, pagesize=page_size)
+        else:
+            pdf.setPageSize(page_size)
         
-        pdf.save()
+        # 画像ごとの準備（読み込み・リサイズ・CMYK変換・エンコード）は互いに独立しているのでスレッドで並列に行う
+        # （PILはデコードやリサイズ中にGILを解放する）。準備済みのものは prepared_readers から再利用する。
+        # PDFへの描画はCanvasがスレッドセーフではないため、この後で順番に行う
+        with ThreadPoolExecutor() as executor:
+            readers = list(executor.map(
+                lambda img_path: get_reader(prepared_readers, img_path, col_width_pt, row_height_pt),
+                test_images
+            ))
+        
+        # セルごとの画像番号と描画位置はループに入る前にNumPyでまとめて計算しておく
+        # （ループ内ではPythonのリストとして参照する方が速いので tolist() で変換する）
+        img_indices, row_y_offsets = compute_offsets(
+            rows, cols, row_height_pt, page_height, len(test_images)
+        )
+        
+        # 画像ごとに1セル分の配置（アスペクト比を保ったセンタリング）をフォームとして一度だけ作っておく
+        # drawImage はセルごとに画像データのハッシュ計算や検証を行うため、セルではフォームを参照するだけにする
+        # フォーム名は準備済み画像のキャッシュのキーから作る（共有のCanvasで再利用しても別の画像を指さない）
+        form_names = []
+        for img_path, reader in zip(test_images, readers):
+            form_name = form_name_for(reader_key(img_path, col_width_pt, row_height_pt))
+            if not pdf.hasForm(form_name):
+                pdf.beginForm(form_name, 0, 0, col_width_pt, row_height_pt)
+                pdf.drawImage(reader, 0, 0, col_width_pt, row_height_pt,
+                              preserveAspectRatio=True, anchor='c', mask='auto')
+                pdf.endForm()
+            form_names.append(form_name)
+        
+        # 行の先頭でその行の左下に移動し、以降はセルの幅ずつ右に移動しながらフォームを描画する
+        # セルごとの命令は「/Form Do」と「1 0 0 1 列の幅 0 cm」だけになり、どのセルでも同じ長さになる
+        # （座標の誤差が積み重ならないよう、移動量の累積は行ごとに q ... Q でリセットする）
+        row_form_names = [[form_names[i] for i in row] for row in img_indices.tolist()]
+        for y_offset, names in zip(row_y_offsets.tolist(), row_form_names):
+            pdf.saveState()
+            pdf.translate(0, y_offset)
+            for form_name in names:
+                pdf.doForm(form_name)
+                pdf.translate(col_width_pt, 0)
+            pdf.restoreState()
         
-        # PDFファイルが存在するか確認
-        if os.path.exists(output_pdf):
-            print(f"PDF生成テスト成功: {output_pdf}")
-            print(f"ファイルサイズ: {os.path.getsize(output_pdf)} バイト")
+        if not owns_pdf:
+            # 呼び出し元のCanvasにページを追加するだけにして、保存はまとめて行ってもらう
+            # （画像の共有は書き出したファイルで確認するため、保存する呼び出し元で count_image_xobjects を使う）
+            pdf.showPage()
+            print("PDF生成テスト成功: 共有のCanvasにページを追加しました")
             return True
-        else:
-            print(f"PDF生成テスト失敗: ファイルが作成されていません")
-            return False
+        
+        pdf.save()
+        
+        # PDFファイルが存在するか確認（存在確認とサイズの取得を1回の stat で行う）
+        try:
+            pdf_stat = os.stat(output_pdf)
+        except FileNotFoundError:
+            raise AssertionError(f"PDFファイルが作成されていません: {output_pdf}") from None
+        
+        # 同じ画像のセルが1つのXObjectを共有していることを、書き出したファイルから確認する
+        # （セルごとに埋め込まれるとPDFが肥大化する）
+        with open(output_pdf, 'rb') as f:
+            embedded_images = count_image_xobjects(f.read())
+        assert embedded_images <= len(test_images), \
+            f"画像がセルごとに埋め込まれています（{embedded_images}個）"
+        print(f"PDF生成テスト成功: {output_pdf}")
+        print(f"ファイルサイズ: {pdf_stat.st_size} バイト")
+        return True
 
 if __name__ == "__main__":
-    result = test_pdf_generation()
+    result = test_pdf_generation({})
     print(f"テスト結果: {'成功' if result else '失敗'}") 
\ No newline at end of file